@@ -0,0 +1,255 @@
+# Esse arquivo reúne os benchmarks do motor: perft (que também confere a geração de movimentos contra contagens conhecidas),
+# nós por segundo do minimax em profundidades fixas e avaliações por segundo (uma a uma e, com o numpy instalado,
+# em lote). Execute a partir da raiz do repositório:
+#   python jogo_de_damas/benchmark.py --output base.json
+#   python jogo_de_damas/benchmark.py --compare base.json --threshold 0.10
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from checkers import batch
+from checkers.notation import parse_position
+from checkers.perft import perft
+from checkers.constants import AZUL_MARINHO
+from minimax.agent import minimax
+from minimax.stats import SearchStats
+
+INITIAL = "W:W21,22,23,24,25,26,27,28,29,30,31,32:B1,2,3,4,5,6,7,8,9,10,11,12"
+
+# Contagens de perft por profundidade (1, 2, ...) com a lei da maioria, conferidas com um gerador independente
+PERFT_POSITIONS = {
+    "inicial": (INITIAL, (7, 49, 302, 1469, 7361, 36473, 177532)),
+    "meio-jogo-8": ("W:W13,21,23,24,25,27,28,29,30,31,32:B1,2,3,4,6,7,8,10,12,15", (9, 50, 289, 1581, 8853)),
+    "meio-jogo-16": ("W:W5,22,24,25,26,27,28,29,30,31:B1,3,4,6,7,8,12,13,15,21", (6, 30, 150, 767, 3039)),
+    "meio-jogo-24": ("W:W12,14,27,29,31,32:B2,3,4,5,7,8,K25", (1, 5, 27, 134, 763)),
+    "damas-1": ("W:WK2,K21,K26:B3,K5,K14,23", (5, 39, 266, 2635, 29322)),
+    "damas-2": ("W:WK8,K9,K32:BK2,3,16,K21,K23,K24", (2, 4, 54, 423, 4131)),
+    "damas-3": ("W:WK4,8,18,K21:BK13,K16,K20,22,26,K30", (9, 118, 917, 9973, 71555)),
+}
+
+SEARCH_POSITIONS = ("inicial", "meio-jogo-8", "meio-jogo-16", "damas-1")
+SEARCH_DEPTHS = (2, 4)
+EVALUATE_CALLS = 20000
+BATCH_SIZE = 4096
+
+
+def _best_time(run, repeat):
+    """Run ``run`` ``repeat`` times and keep the fastest timing, which is the least affected by noise.
+
+    Args:
+        run (Callable[[], int]): Work to time; returns the number of nodes it processed.
+        repeat (int): Number of runs.
+
+    Returns:
+        tuple[int, float]: Nodes of the last run and the best elapsed time in seconds.
+    """
+    best = float("inf")
+    nodes = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        nodes = run()
+        best = min(best, time.perf_counter() - started)
+    return nodes, best
+
+
+def bench_perft(max_depth, repeat):
+    """Run perft on every fixed position and check the counts.
+
+    Args:
+        max_depth (int): Deepest perft level to run per position.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict: Per-position depth, nodes, expected nodes, correctness and nodes per second.
+    """
+    results = {}
+    for name, (text, expected) in PERFT_POSITIONS.items():
+        board, color = parse_position(text)
+        depth = min(max_depth, len(expected))
+        nodes, seconds = _best_time(lambda: perft(board, color, depth), repeat)
+        results[name] = {
+            "depth": depth,
+            "nodes": nodes,
+            "expected": expected[depth - 1],
+            "ok": nodes == expected[depth - 1],
+            "nps": nodes / seconds,
+        }
+    return results
+
+
+def bench_search(depths, repeat):
+    """Measure the nodes per second of ``minimax`` at fixed depths.
+
+    Args:
+        depths (Iterable[int]): Search depths to measure.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict: Nodes, seconds and nodes per second for every depth, over all search positions.
+    """
+    results = {}
+    for depth in depths:
+        def run():
+            nodes = 0
+            for name in SEARCH_POSITIONS:
+                board, color = parse_position(PERFT_POSITIONS[name][0])
+                stats = SearchStats()
+                minimax(board, depth, color == AZUL_MARINHO, None, stats=stats)
+                nodes += stats.nodes
+            return nodes
+
+        nodes, seconds = _best_time(run, repeat)
+        results[f"d{depth}"] = {"nodes": nodes, "seconds": seconds, "nps": nodes / seconds}
+    return results
+
+
+def bench_evaluate(calls, repeat):
+    """Measure how many static evaluations per second ``Board.evaluate`` performs.
+
+    Args:
+        calls (int): Evaluations per timed run, spread over all fixed positions.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict: Calls, seconds and evaluations per second.
+    """
+    boards = [parse_position(text)[0] for text, _ in PERFT_POSITIONS.values()]
+    rounds = max(1, calls // len(boards))
+
+    def run():
+        for _ in range(rounds):
+            for board in boards:
+                board.evaluate()
+        return rounds * len(boards)
+
+    count, seconds = _best_time(run, repeat)
+    return {"calls": count, "seconds": seconds, "per_second": count / seconds}
+
+
+def bench_evaluate_batch(calls, repeat):
+    """Measure how many positions per second ``evaluate_batch`` scores, in batches of ``BATCH_SIZE``.
+
+    Args:
+        calls (int): Positions scored per timed run, spread over all fixed positions.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict | None: Calls, seconds and evaluations per second, or ``None`` without numpy.
+    """
+    if batch.np is None:
+        return None
+    boards = [parse_position(text)[0] for text, _ in PERFT_POSITIONS.values()]
+    positions = batch.PositionBatch.from_boards((boards * (BATCH_SIZE // len(boards) + 1))[:BATCH_SIZE])
+    rounds = max(1, calls // BATCH_SIZE)
+
+    def run():
+        for _ in range(rounds):
+            batch.evaluate_batch(positions)
+        return rounds * BATCH_SIZE
+
+    count, seconds = _best_time(run, repeat)
+    return {"calls": count, "seconds": seconds, "per_second": count / seconds}
+
+
+def throughput(report):
+    """Flatten the throughput figures of a report into ``name -> operations per second``.
+
+    Args:
+        report (dict): Report produced by ``main``.
+
+    Returns:
+        dict[str, float]: Throughput of every measurement.
+    """
+    metrics = {f"perft/{name}": result["nps"] for name, result in report["perft"].items()}
+    metrics.update({f"search/{name}": result["nps"] for name, result in report["search"].items()})
+    metrics["evaluate"] = report["evaluate"]["per_second"]
+    if report.get("evaluate_batch"):
+        metrics["evaluate_batch"] = report["evaluate_batch"]["per_second"]
+    return metrics
+
+
+def compare(report, baseline, threshold):
+    """Print the change of every metric against ``baseline`` and list the regressions.
+
+    Args:
+        report (dict): Current report.
+        baseline (dict): Stored report to compare against.
+        threshold (float): Largest accepted drop, as a fraction (0.10 = 10%).
+
+    Returns:
+        list[str]: Names of the metrics that regressed beyond ``threshold``.
+    """
+    current = throughput(report)
+    previous = throughput(baseline)
+    regressions = []
+    for name, value in current.items():
+        if name not in previous:
+            continue
+        change = value / previous[name] - 1
+        regressed = change < -threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<24} {previous[name]:>12.0f} -> {value:>12.0f}/s  {change:+.1%}{'  REGRESSÃO' if regressed else ''}")
+    return regressions
+
+
+def main():
+    """Run the benchmarks, write the JSON report and optionally compare it with a baseline.
+
+    Exits with status 1 when a perft count is wrong or when a metric regresses
+    beyond the threshold.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks de perft, busca e avaliação.")
+    parser.add_argument("--perft-depth", type=int, default=5)
+    parser.add_argument("--search-depths", type=int, nargs="+", default=list(SEARCH_DEPTHS))
+    parser.add_argument("--evaluate-calls", type=int, default=EVALUATE_CALLS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="arquivo JSON de saída (padrão: saída padrão)")
+    parser.add_argument("--compare", metavar="BASELINE", help="relatório JSON de referência")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    report = {
+        "python": platform.python_version(),
+        "perft": bench_perft(args.perft_depth, args.repeat),
+        "search": bench_search(args.search_depths, args.repeat),
+        "evaluate": bench_evaluate(args.evaluate_calls, args.repeat),
+        "evaluate_batch": bench_evaluate_batch(args.evaluate_calls * 10, args.repeat),
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    failed = False
+    for name, result in report["perft"].items():
+        if not result["ok"]:
+            print(f"perft {name} profundidade {result['depth']}: {result['nodes']} nós, esperado {result['expected']}")
+            failed = True
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} métrica(s) abaixo do limite de {args.threshold:.0%}: {', '.join(regressions)}")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
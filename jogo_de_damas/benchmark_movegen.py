@@ -0,0 +1,196 @@
+# Esse arquivo compara o gerador de movimentos por tabelas de diagonais com a travessia recursiva que o Board
+# usava antes, em finais com muitas damas. Os dois geram todas as jogadas de um lado de uma vez e nenhum passa pelo
+# cache de Board.legal_moves, então o tempo medido é só o da geração. Execute a partir da raiz do repositório:
+#   python jogo_de_damas/benchmark_movegen.py --positions 200 --repeat 20
+
+import argparse
+import random
+import time
+
+from checkers.board import Board
+from checkers.constants import ROWS, COLS, AZUL_MARINHO, WHITE
+from checkers.movegen import generate_moves
+
+SEED = 7
+
+
+def _legacy_traverse(grid, start, stop, step, color, col, col_step, king, skipped=()):
+    """Port of the recursive ``_traverse_*`` / ``king_traverse_*`` methods, kept only as a baseline.
+
+    Args:
+        grid (list[list]): Board matrix.
+        start (int): Starting row.
+        stop (int): Stopping row boundary (exclusive).
+        step (int): Row increment direction.
+        color (tuple): Color of the moving piece.
+        col (int): Starting column.
+        col_step (int): Column increment, ``-1`` for left and ``1`` for right.
+        king (bool): Whether the flying-king variant is used.
+        skipped (list, optional): Pieces captured so far in the path.
+
+    Returns:
+        dict[tuple, list]: Candidate moves and their captured pieces.
+    """
+    moves = {}
+    last = []
+    for r in range(start, stop, step):
+        if col < 0 or col >= COLS:
+            break
+        current = grid[r][col]
+        if current == 0:
+            if skipped and not last:
+                break
+            elif skipped:
+                moves[(r, col)] = last + list(skipped)
+            else:
+                moves[(r, col)] = last
+
+            if last:
+                if king:
+                    row = -1 if step == -1 else ROWS
+                else:
+                    row = max(r - 3, -1) if step == -1 else min(r + 3, ROWS)
+                moves.update(_legacy_traverse(grid, r + step, row, step, color, col - 1, -1, king, last))
+                moves.update(_legacy_traverse(grid, r + step, row, step, color, col + 1, 1, king, last))
+            if last or not king:
+                break
+        elif current.color == color:
+            break
+        else:
+            last = [current]
+        col += col_step
+    return moves
+
+
+def legacy_moves(board, piece, check_captures=True):
+    """Return the moves of ``piece`` the way ``Board.get_valid_moves`` computed them before the ray tables.
+
+    Args:
+        board (Board): Board to read the matrix from.
+        piece (Piece): Piece to evaluate.
+        check_captures (bool, optional): Whether to enforce the capture priority.
+
+    Returns:
+        dict[tuple, list]: Mapping of (row, col) to a list of captured pieces.
+    """
+    grid = board.board
+    row, left, right = piece.row, piece.col - 1, piece.col + 1
+    moves = {}
+    if piece.king:
+        moves.update(_legacy_traverse(grid, row - 1, -1, -1, piece.color, left, -1, True))
+        moves.update(_legacy_traverse(grid, row - 1, -1, -1, piece.color, right, 1, True))
+        moves.update(_legacy_traverse(grid, row + 1, ROWS, 1, piece.color, left, -1, True))
+        moves.update(_legacy_traverse(grid, row + 1, ROWS, 1, piece.color, right, 1, True))
+    if piece.color == WHITE:
+        moves.update(_legacy_traverse(grid, row - 1, max(row - 3, -1), -1, piece.color, left, -1, False))
+        moves.update(_legacy_traverse(grid, row - 1, max(row - 3, -1), -1, piece.color, right, 1, False))
+    else:
+        moves.update(_legacy_traverse(grid, row + 1, min(row + 3, ROWS), 1, piece.color, left, -1, False))
+        moves.update(_legacy_traverse(grid, row + 1, min(row + 3, ROWS), 1, piece.color, right, 1, False))
+
+    if check_captures:
+        has_capture = any(
+            skipped
+            for other in board.get_pieces(piece.color)
+            for skipped in legacy_moves(board, other, check_captures=False).values()
+        )
+        if has_capture:
+            moves = {move: skipped for move, skipped in moves.items() if skipped}
+    return moves
+
+
+def king_endgames(count, seed=SEED):
+    """Build reproducible endgames with mostly kings and a few men on each side.
+
+    Args:
+        count (int): Number of positions.
+        seed (int, optional): Random seed.
+
+    Returns:
+        list[Board]: Endgame boards.
+    """
+    rng = random.Random(seed)
+    squares = [(row, col) for row in range(ROWS) for col in range(COLS) if (row + col) % 2]
+    boards = []
+    for _ in range(count):
+        pieces = []
+        for color in (WHITE, AZUL_MARINHO):
+            kings = rng.randint(2, 4)
+            men = rng.randint(0, 2)
+            for index in range(kings + men):
+                taken = {(p[1], p[2]) for p in pieces}
+                row, col = rng.choice([sq for sq in squares if sq not in taken])
+                far_rank = row == (0 if color == WHITE else ROWS - 1)
+                pieces.append((color, row, col, index < kings or far_rank))
+        boards.append(Board.from_pieces(pieces))
+    return boards
+
+
+def legacy_side_moves(board, color):
+    """Return the moves of every piece of ``color`` with the legacy traversal.
+
+    Args:
+        board (Board): Board to read the matrix from.
+        color (tuple): Color to move.
+
+    Returns:
+        list[dict[tuple, list]]: Moves of each piece, as ``legacy_moves`` returns them.
+    """
+    return [legacy_moves(board, piece) for piece in board.get_pieces(color)]
+
+
+def table_side_moves(board, color):
+    """Return the moves of ``color`` with the ray-table generator, bypassing the ``legal_moves`` cache.
+
+    Args:
+        board (Board): Board to generate from.
+        color (tuple): Color to move.
+
+    Returns:
+        list[tuple]: Move records.
+    """
+    return generate_moves(board.bits, color)
+
+
+def _time_all_moves(boards, generate, repeat):
+    """Time generating the moves of both sides on ``boards``.
+
+    Args:
+        boards (list[Board]): Positions to generate from.
+        generate (Callable[[Board, tuple], object]): Side-wide move generator under test.
+        repeat (int): Number of passes over the positions.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for board in boards:
+            for color in (WHITE, AZUL_MARINHO):
+                generate(board, color)
+    return time.perf_counter() - started
+
+
+def main():
+    """Print the time taken by the legacy traversal and by the ray-table generator.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Gerador por tabelas de diagonais vs. travessia recursiva.")
+    parser.add_argument("--positions", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    boards = king_endgames(args.positions)
+    legacy = _time_all_moves(boards, legacy_side_moves, args.repeat)
+    rays = _time_all_moves(boards, table_side_moves, args.repeat)
+    print(f"travessia recursiva: {legacy:.3f}s")
+    print(f"tabelas de diagonais: {rays:.3f}s  ({legacy / rays:.1f}x mais rápido)")
+
+
+if __name__ == "__main__":
+    main()
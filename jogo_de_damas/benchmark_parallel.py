@@ -0,0 +1,76 @@
+# Esse arquivo mede o ganho da busca paralela em relação à busca sequencial, variando o número de processos
+# sobre um conjunto fixo de posições. Execute a partir da raiz do repositório:
+#   python jogo_de_damas/benchmark_parallel.py --depth 6 --workers 1 2 4 8 16
+
+import argparse
+import multiprocessing
+import random
+import time
+
+from checkers.board import Board
+from checkers.constants import AZUL_MARINHO, WHITE
+from minimax.agent import minimax, get_all_moves, simulate_move
+from minimax.parallel import ParallelSearch
+
+SEED = 2024
+OPENING_PLIES = (0, 4, 8, 12, 16, 20)
+
+
+def fixed_positions(seed=SEED, plies=OPENING_PLIES):
+    """Build a reproducible list of positions by random play from the initial board.
+
+    Args:
+        seed (int, optional): Seed of the random move choice.
+        plies (tuple[int], optional): Number of moves played before each position.
+
+    Returns:
+        list[tuple[Board, bool]]: Boards and whether dark blue is to move.
+    """
+    positions = []
+    for index, count in enumerate(plies):
+        rng = random.Random(seed + index)
+        board = Board()
+        turn = WHITE
+        for _ in range(count):
+            moves = get_all_moves(board, turn, None)
+            if not moves or board.winner() is not None:
+                break
+            simulate_move(rng.choice(moves), board)
+            turn = AZUL_MARINHO if turn == WHITE else WHITE
+        positions.append((board, turn == AZUL_MARINHO))
+    return positions
+
+
+def main():
+    """Time the sequential and parallel searches and print the speedup per worker count.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Speedup da busca paralela por número de processos.")
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, multiprocessing.cpu_count()}))
+    args = parser.parse_args()
+
+    positions = fixed_positions()
+
+    started = time.perf_counter()
+    expected = [minimax(board, args.depth, max_player, None)[0] for board, max_player in positions]
+    sequential = time.perf_counter() - started
+    print(f"sequencial: {sequential:.2f}s ({len(positions)} posições, profundidade {args.depth})")
+
+    for workers in args.workers:
+        with ParallelSearch(workers) as search:
+            started = time.perf_counter()
+            scores = [search.search(board, args.depth, max_player)[0] for board, max_player in positions]
+            elapsed = time.perf_counter() - started
+        status = "ok" if scores == expected else "DIVERGENTE"
+        print(f"{workers:>3} processos: {elapsed:.2f}s  speedup {sequential / elapsed:.2f}x  [{status}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Esse arquivo gera o livro de aberturas: todas as posições dos primeiros lances da partida são buscadas a fundo,
+# em paralelo, e a melhor jogada de cada uma é gravada no arquivo binário lido por minimax/book.py.
+# Execute a partir da raiz do repositório:
+#   python jogo_de_damas/build_book.py --plies 6 --depth 10 --workers 8
+
+import argparse
+import multiprocessing
+import os
+import time
+from copy import deepcopy
+
+from checkers.board import Board
+from checkers.constants import AZUL_MARINHO, WHITE
+from checkers.notation import parse_position, position_text
+from checkers.zobrist import position_key
+from minimax.agent import iterative_deepening
+from minimax.book import write_book
+from minimax.stats import SearchStats
+
+PLIES = 6
+DEPTH = 10
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "abertura.bin")
+
+
+def opening_positions(plies):
+    """List every distinct position reachable from the initial board in fewer than ``plies`` moves.
+
+    Args:
+        plies (int): Number of half-moves covered by the book.
+
+    Returns:
+        list[tuple[str, bool]]: Position text and whether dark blue is to move, in ply order.
+    """
+    seen = set()
+    positions = []
+    frontier = [(Board(), WHITE)]
+    for _ in range(plies):
+        following = []
+        for board, color in frontier:
+            max_player = color == AZUL_MARINHO
+            key = position_key(board, max_player)
+            if key in seen or board.outcome(color) is not None:
+                continue
+            seen.add(key)
+            positions.append((position_text(board, color), max_player))
+            for move in board.legal_moves(color):
+                child = deepcopy(board)
+                child.make_move(move)
+                following.append((child, AZUL_MARINHO if color == WHITE else WHITE))
+        frontier = following
+    return positions
+
+
+def search_position(task):
+    """Search one book position in a worker process.
+
+    Args:
+        task (tuple[str, bool, int]): Position text, side to move and search depth.
+
+    Returns:
+        tuple[int, tuple, float, int]: Position key, best move, score and depth reached.
+    """
+    text, max_player, depth = task
+    board, _ = parse_position(text)
+    stats = SearchStats()
+    score, _ = iterative_deepening(board, max_player, None, max_depth=depth, stats=stats)
+    return position_key(board, max_player), stats.principal_variation[0], score, stats.depth
+
+
+def main():
+    """Search every opening position on a process pool and write the book.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Gera o livro de aberturas.")
+    parser.add_argument("--plies", type=int, default=PLIES, help="lances cobertos pelo livro")
+    parser.add_argument("--depth", type=int, default=DEPTH, help="profundidade da busca de cada posição")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--output", default=OUTPUT)
+    args = parser.parse_args()
+
+    positions = opening_positions(args.plies)
+    print(f"{len(positions)} posições nos primeiros {args.plies} lances")
+
+    started = time.perf_counter()
+    entries = []
+    tasks = [(text, max_player, args.depth) for text, max_player in positions]
+    with multiprocessing.Pool(args.workers) as pool:
+        for entry in pool.imap_unordered(search_position, tasks, chunksize=1):
+            entries.append(entry)
+            if len(entries) % 100 == 0 or len(entries) == len(tasks):
+                print(f"[{len(entries)}/{len(tasks)}] {time.perf_counter() - started:.0f}s")
+
+    count = write_book(args.output, entries)
+    print(f"{count} posições gravadas em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
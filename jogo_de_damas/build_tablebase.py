@@ -0,0 +1,74 @@
+# Esse arquivo gera as tabelas de finais lidas por minimax/tablebase.py. As combinações de material são resolvidas em
+# ordem, das que têm menos peças para as que têm mais, e as de um mesmo nível (que não dependem umas das outras) em
+# paralelo. Execute a partir da raiz do repositório:
+#   python jogo_de_damas/build_tablebase.py --pieces 3 --workers 8
+
+import argparse
+import multiprocessing
+import os
+import time
+from itertools import groupby
+
+from minimax.tablebase import signatures, solve, table_size, write_tablebase
+
+PIECES = 3
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "finais.bin")
+
+_solved = {}
+
+
+def _share(tables):
+    """Pool initializer: keep the tables of the previous levels in the worker process.
+
+    Args:
+        tables (dict[tuple, bytes]): Every table solved so far.
+
+    Returns:
+        None
+    """
+    _solved.update(tables)
+
+
+def solve_signature(signature):
+    """Solve one material balance in a worker process.
+
+    Args:
+        signature (tuple[int, int, int, int]): Material balance.
+
+    Returns:
+        tuple[tuple, bytearray]: The balance and its table.
+    """
+    return signature, solve(signature, _solved)
+
+
+def main():
+    """Solve every balance with up to ``--pieces`` pieces and write the tables.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Gera as tabelas de finais.")
+    parser.add_argument("--pieces", type=int, default=PIECES, help="número máximo de peças no tabuleiro")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--output", default=OUTPUT)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    tables = {}
+    # Um nível é o total de peças e de homens: capturas e promoções só levam a níveis anteriores
+    levels = groupby(signatures(args.pieces), key=lambda signature: (sum(signature), signature[0] + signature[2]))
+    for _, level in levels:
+        with multiprocessing.Pool(args.workers, initializer=_share, initargs=(tables,)) as pool:
+            for signature, values in pool.imap_unordered(solve_signature, list(level)):
+                tables[signature] = values
+                print(f"{signature}: {table_size(signature)} posições, {time.perf_counter() - started:.0f}s")
+
+    count = write_tablebase(args.output, dict(sorted(tables.items())), args.pieces)
+    print(f"{len(tables)} tabelas, {count} posições gravadas em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
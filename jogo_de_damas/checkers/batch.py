@@ -0,0 +1,149 @@
+from .bitboard import DIRECTIONS, shift
+from .evaluation import DARKBLUE_TABLE, WHITE_TABLE, MAN_VALUE, KING_BONUS, PROTECTION_BONUS
+
+try:
+    import numpy as np
+except ImportError: # O numpy é opcional: só a avaliação em lote depende dele
+    np = None
+
+# Esse arquivo avalia muitas posições de uma vez com o NumPy: cada posição vira uma linha de vetores de bitboards,
+# e a mesma heurística de Board.evaluate é calculada para todas numa única sequência de operações vetorizadas.
+
+if np is not None:
+    _DARKBLUE_VECTOR = np.array(DARKBLUE_TABLE, dtype=np.int64)
+    _WHITE_VECTOR = np.array(WHITE_TABLE, dtype=np.int64)
+
+
+def _require_numpy():
+    """Fail with a clear message when NumPy is not installed.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        ImportError: If NumPy is missing.
+    """
+    if np is None:
+        raise ImportError("A avaliação em lote precisa do numpy: pip install numpy")
+
+
+def _bit_matrix(masks):
+    """Expand 32-bit masks into one row of 0/1 values per mask.
+
+    Args:
+        masks (numpy.ndarray): Masks of shape ``(n,)``.
+
+    Returns:
+        numpy.ndarray: ``uint8`` matrix of shape ``(n, 32)``; column ``sq`` is bit ``sq``.
+    """
+    as_bytes = np.ascontiguousarray(masks, dtype="<u4").view(np.uint8).reshape(-1, 4)
+    return np.unpackbits(as_bytes, axis=1, bitorder="little")
+
+
+class PositionBatch:
+    """Positions stored as parallel NumPy arrays, ready for ``evaluate_batch``."""
+
+    def __init__(self, darkblue, white, kings, darkblue_kings=None, white_kings=None):
+        """Store the bitboards of every position.
+
+        Args:
+            darkblue (Sequence[int]): Dark blue mask of each position.
+            white (Sequence[int]): White mask of each position.
+            kings (Sequence[int]): King mask of each position.
+            darkblue_kings (Sequence[int], optional): Dark blue promotion counters; by
+                default the kings on the board, as in ``Board.from_pieces``.
+            white_kings (Sequence[int], optional): White promotion counters, with the same default.
+
+        Returns:
+            None
+        """
+        _require_numpy()
+        self.darkblue = np.asarray(darkblue, dtype=np.uint64)
+        self.white = np.asarray(white, dtype=np.uint64)
+        self.kings = np.asarray(kings, dtype=np.uint64)
+        if darkblue_kings is None:
+            darkblue_kings = _bit_matrix(self.darkblue & self.kings).sum(axis=1)
+        if white_kings is None:
+            white_kings = _bit_matrix(self.white & self.kings).sum(axis=1)
+        self.darkblue_kings = np.asarray(darkblue_kings, dtype=np.int64)
+        self.white_kings = np.asarray(white_kings, dtype=np.int64)
+
+    @classmethod
+    def from_boards(cls, boards):
+        """Encode ``Board`` objects, keeping their promotion counters.
+
+        Args:
+            boards (Iterable[Board]): Positions to encode.
+
+        Returns:
+            PositionBatch: One row per board, in the same order.
+        """
+        boards = list(boards)
+        return cls(
+            [board.bits.darkblue for board in boards],
+            [board.bits.white for board in boards],
+            [board.bits.kings for board in boards],
+            [board.darkblue_kings for board in boards],
+            [board.white_kings for board in boards],
+        )
+
+    def __len__(self):
+        """Return the number of positions in the batch.
+
+        Args:
+            None
+
+        Returns:
+            int: Number of rows.
+        """
+        return len(self.darkblue)
+
+
+def _protected(own):
+    """Return, for every mask, the pieces that have a friendly piece diagonally adjacent.
+
+    Args:
+        own (numpy.ndarray): Masks of one side.
+
+    Returns:
+        numpy.ndarray: Masks of the protected pieces.
+    """
+    neighbours = np.zeros_like(own)
+    for direction in DIRECTIONS:
+        neighbours |= shift(own, direction)
+    return own & neighbours
+
+
+def evaluate_batch(batch):
+    """Score every position of ``batch`` with the heuristic of ``Board.evaluate``.
+
+    Args:
+        batch (PositionBatch): Positions to score.
+
+    Returns:
+        numpy.ndarray: ``int64`` scores from the dark blue point of view, one per position.
+    """
+    _require_numpy()
+    darkblue = _bit_matrix(batch.darkblue).astype(np.int64)
+    white = _bit_matrix(batch.white).astype(np.int64)
+    score = (darkblue.sum(axis=1) - white.sum(axis=1)) * MAN_VALUE
+    score += (batch.darkblue_kings - batch.white_kings) * KING_BONUS
+    score += darkblue @ _DARKBLUE_VECTOR - white @ _WHITE_VECTOR
+    protected = _bit_matrix(_protected(batch.darkblue)).sum(axis=1, dtype=np.int64)
+    protected -= _bit_matrix(_protected(batch.white)).sum(axis=1, dtype=np.int64)
+    return score + protected * PROTECTION_BONUS
+
+
+def evaluate_boards(boards):
+    """Score a list of ``Board`` objects in one vectorised call.
+
+    Args:
+        boards (Iterable[Board]): Positions to score.
+
+    Returns:
+        numpy.ndarray: ``int64`` scores, equal to calling ``evaluate`` on each board.
+    """
+    return evaluate_batch(PositionBatch.from_boards(boards))
@@ -0,0 +1,300 @@
+from .constants import ROWS, COLS, WHITE
+
+# Esse arquivo implementa a representação em bitboard do tabuleiro: cada lado é uma máscara de 32 bits sobre as casas jogáveis,
+# e a geração de movimentos e capturas é feita com deslocamentos (shifts) e máscaras em vez de percorrer a matriz 8x8.
+
+SQUARES = ROWS * COLS // 2
+FULL = (1 << SQUARES) - 1
+
+UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT = range(4)
+DIRECTIONS = (UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT)
+
+EVEN_ROWS = sum(0xF << (row * 4) for row in range(0, ROWS, 2))
+ODD_ROWS = FULL ^ EVEN_ROWS
+# Nas linhas pares a casa de índice 3 fica na coluna 7; nas ímpares a de índice 0 fica na coluna 0
+RIGHT_EDGE = sum(1 << (row * 4 + 3) for row in range(0, ROWS, 2))
+LEFT_EDGE = sum(1 << (row * 4) for row in range(1, ROWS, 2))
+
+# (deslocamento nas linhas pares, máscara válida nas pares, deslocamento nas ímpares, máscara válida nas ímpares)
+_SHIFTS = {
+    UP_LEFT: (-4, EVEN_ROWS, -5, ODD_ROWS & ~LEFT_EDGE),
+    UP_RIGHT: (-3, EVEN_ROWS & ~RIGHT_EDGE, -4, ODD_ROWS),
+    DOWN_LEFT: (4, EVEN_ROWS, 3, ODD_ROWS & ~LEFT_EDGE),
+    DOWN_RIGHT: (5, EVEN_ROWS & ~RIGHT_EDGE, 4, ODD_ROWS),
+}
+
+# Direções em que cada lado avança: as brancas sobem e o azul marinho desce
+WHITE_FORWARD = (UP_LEFT, UP_RIGHT)
+DARKBLUE_FORWARD = (DOWN_LEFT, DOWN_RIGHT)
+
+
+def square(row, col):
+    """Return the bit index of the playable square ``(row, col)``.
+
+    Args:
+        row (int): Matrix row.
+        col (int): Matrix column.
+
+    Returns:
+        int: Index between 0 and 31.
+    """
+    return row * 4 + col // 2
+
+
+def coords(sq):
+    """Return the ``(row, col)`` matrix coordinates of bit index ``sq``.
+
+    Args:
+        sq (int): Index between 0 and 31.
+
+    Returns:
+        tuple[int, int]: Row and column of the square.
+    """
+    row = sq // 4
+    return row, 2 * (sq % 4) + (1 - row % 2)
+
+
+def _offset(mask, amount):
+    """Shift ``mask`` by ``amount`` bits, discarding anything outside the board.
+
+    Args:
+        mask (int): Bitmask to shift.
+        amount (int): Positive to shift towards higher indexes, negative otherwise.
+
+    Returns:
+        int: Shifted mask.
+    """
+    if amount > 0:
+        return (mask << amount) & FULL
+    return mask >> -amount
+
+
+def shift(mask, direction):
+    """Move every bit of ``mask`` one diagonal step towards ``direction``.
+
+    Args:
+        mask (int): Bitmask of squares.
+        direction (int): One of ``UP_LEFT``, ``UP_RIGHT``, ``DOWN_LEFT`` or ``DOWN_RIGHT``.
+
+    Returns:
+        int: Mask of the neighbouring squares that exist on the board.
+    """
+    even_amount, even_valid, odd_amount, odd_valid = _SHIFTS[direction]
+    return _offset(mask & even_valid, even_amount) | _offset(mask & odd_valid, odd_amount)
+
+
+def iter_squares(mask):
+    """Yield the index of every set bit of ``mask`` in increasing order.
+
+    Args:
+        mask (int): Bitmask of squares.
+
+    Returns:
+        Iterator[int]: Square indexes, which follow the row-major order of the matrix.
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitBoard:
+    """Compact position made of one 32-bit mask per side plus a kings mask."""
+    __slots__ = ("darkblue", "white", "kings")
+
+    def __init__(self, darkblue=0, white=0, kings=0):
+        """Store the three masks that describe the position.
+
+        Args:
+            darkblue (int, optional): Squares occupied by dark blue pieces.
+            white (int, optional): Squares occupied by white pieces.
+            kings (int, optional): Squares occupied by kings of either side.
+
+        Returns:
+            None
+        """
+        self.darkblue = darkblue
+        self.white = white
+        self.kings = kings
+
+    def side(self, color):
+        """Return the mask of the pieces that belong to ``color``.
+
+        Args:
+            color (tuple): RGB tuple that represents the owner color.
+
+        Returns:
+            int: Bitmask of the side.
+        """
+        return self.white if color == WHITE else self.darkblue
+
+    def opponent(self, color):
+        """Return the mask of the pieces that do not belong to ``color``.
+
+        Args:
+            color (tuple): RGB tuple that represents the owner color.
+
+        Returns:
+            int: Bitmask of the opposing side.
+        """
+        return self.darkblue if color == WHITE else self.white
+
+    def empty(self):
+        """Return the mask of the playable squares without pieces.
+
+        Args:
+            None
+
+        Returns:
+            int: Bitmask of the empty squares.
+        """
+        return FULL & ~(self.darkblue | self.white)
+
+    def place(self, color, sq, king=False):
+        """Put a piece of ``color`` on ``sq``.
+
+        Args:
+            color (tuple): RGB tuple of the piece.
+            sq (int): Target square index.
+            king (bool, optional): Whether the piece is a king.
+
+        Returns:
+            None
+        """
+        bit = 1 << sq
+        if color == WHITE:
+            self.white |= bit
+        else:
+            self.darkblue |= bit
+        if king:
+            self.kings |= bit
+
+    def move(self, origin, dest):
+        """Move whatever piece stands on ``origin`` to ``dest``.
+
+        Args:
+            origin (int): Square index the piece leaves.
+            dest (int): Square index the piece arrives at.
+
+        Returns:
+            None
+        """
+        if origin == dest:
+            # Uma dama pode capturar em círculo e terminar na própria casa de origem
+            return
+        both = (1 << origin) | (1 << dest)
+        if self.white >> origin & 1:
+            self.white ^= both
+        else:
+            self.darkblue ^= both
+        if self.kings >> origin & 1:
+            self.kings ^= both
+
+    def crown(self, sq):
+        """Mark the piece on ``sq`` as a king.
+
+        Args:
+            sq (int): Square index of the promoted piece.
+
+        Returns:
+            None
+        """
+        self.kings |= 1 << sq
+
+    def clear(self, mask):
+        """Remove every piece covered by ``mask``.
+
+        Args:
+            mask (int): Squares to empty.
+
+        Returns:
+            None
+        """
+        keep = ~mask
+        self.darkblue &= keep
+        self.white &= keep
+        self.kings &= keep
+
+    def has_capture(self, color):
+        """Return ``True`` if any piece of ``color`` can capture an opponent.
+
+        Men capture forward over an adjacent piece; kings slide over empty
+        squares before jumping. Both are tested for the whole side at once.
+
+        Args:
+            color (tuple): Color to check.
+
+        Returns:
+            bool: ``True`` if there is at least one capture available.
+        """
+        own = self.side(color)
+        opp = self.opponent(color)
+        empty = self.empty()
+        men = own & ~self.kings
+        forward = WHITE_FORWARD if color == WHITE else DARKBLUE_FORWARD
+        for direction in forward:
+            if shift(shift(men, direction) & opp, direction) & empty:
+                return True
+
+        kings = own & self.kings
+        if kings:
+            for direction in DIRECTIONS:
+                frontier = shift(kings, direction)
+                while frontier:
+                    if shift(frontier & opp, direction) & empty:
+                        return True
+                    frontier = shift(frontier & empty, direction)
+        return False
+
+    def has_move(self, color):
+        """Return ``True`` if ``color`` has at least one legal move.
+
+        Args:
+            color (tuple): Color to check.
+
+        Returns:
+            bool: ``False`` when every piece of the side is blocked (or there are none).
+        """
+        if self.has_capture(color):
+            return True
+        own = self.side(color)
+        empty = self.empty()
+        men = own & ~self.kings
+        kings = own & self.kings
+        forward = WHITE_FORWARD if color == WHITE else DARKBLUE_FORWARD
+        for direction in DIRECTIONS:
+            movers = men | kings if direction in forward else kings
+            if shift(movers, direction) & empty:
+                return True
+        return False
+
+    def quiet_moves(self, sq):
+        """Return the non-capturing destinations of the piece on ``sq``.
+
+        Kings slide along the four diagonals (nearest square first) and men
+        step one square forward. The order matches the one produced by the
+        diagonal traversal in ``Board``.
+
+        Args:
+            sq (int): Square index of the piece.
+
+        Returns:
+            list[int]: Destination square indexes.
+        """
+        bit = 1 << sq
+        empty = self.empty()
+        targets = []
+        if self.kings & bit:
+            for direction in DIRECTIONS:
+                step = shift(bit, direction) & empty
+                while step:
+                    targets.append(step.bit_length() - 1)
+                    step = shift(step, direction) & empty
+            return targets
+
+        forward = WHITE_FORWARD if self.white & bit else DARKBLUE_FORWARD
+        for direction in forward:
+            step = shift(bit, direction) & empty
+            if step:
+                targets.append(step.bit_length() - 1)
+        return targets
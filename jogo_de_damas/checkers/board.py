@@ -1,9 +1,15 @@
-import pygame
-from .constants import BLACK, ROWS, COLS, PERU, SQUARE_SIZE, AZUL_MARINHO, WHITE
+from .constants import ROWS, COLS, AZUL_MARINHO, WHITE, DRAW
 from .piece import Piece
+from .bitboard import BitBoard, square, coords, iter_squares
+from .movegen import capture_sequences, generate_moves
+from .zobrist import piece_key, hash_position
+from .evaluation import DARKBLUE_TABLE, WHITE_TABLE, MAN_VALUE, KING_BONUS, PROTECTION_BONUS, positional_score, protected_count
 
 # Esse arquivo lida com a lógica do tabuleiro de damas, incluindo a criação do tabuleiro, movimentação das peças, remoção de peças capturadas e verificação de movimentos válidos.
 
+# Empate após 20 lances de cada lado só com damas e sem captura
+DRAW_KING_PLIES = 40
+
 class Board:
     """Represents the checkers board along with all move-generation logic."""
 
@@ -17,10 +23,48 @@ class Board:
             None
         """
         self.board = []
+        self.bits = BitBoard()
         self.darkblue_left = self.white_left = 12
         self.darkblue_kings = self.white_kings = 0
+        self.hash_key = 0
+        self.positional = 0
+        self._legal = (None, None) # (cor, jogadas) da posição atual; descartado a cada mudança no tabuleiro
+        self.history = [] # chave de Zobrist de cada posição anterior da partida
+        self.reversible = 0 # lances seguidos de dama sem captura
         self.create_board()
     
+    @classmethod
+    def from_pieces(cls, pieces):
+        """Build a board holding exactly ``pieces``, e.g. a test position or an endgame.
+
+        Since the promotion history is unknown, the ``*_kings`` counters are
+        set to the number of kings on the board.
+
+        Args:
+            pieces (Iterable[tuple]): ``(color, row, col, king)`` tuples.
+
+        Returns:
+            Board: New board with the given layout.
+        """
+        board = cls()
+        board.board = [[0] * COLS for _ in range(ROWS)]
+        board.bits = BitBoard()
+        for color, row, col, king in pieces:
+            piece = Piece(color, row, col)
+            if king:
+                piece.make_king()
+            board.board[row][col] = piece
+            board.bits.place(color, square(row, col), king)
+
+        bits = board.bits
+        board.darkblue_left = bits.darkblue.bit_count()
+        board.white_left = bits.white.bit_count()
+        board.darkblue_kings = (bits.darkblue & bits.kings).bit_count()
+        board.white_kings = (bits.white & bits.kings).bit_count()
+        board.hash_key = hash_position(bits)
+        board.positional = positional_score(bits)
+        return board
+
     def get_piece(self, row, col):
         """Return the piece that sits on ``(row, col)``.
 
@@ -33,20 +77,6 @@ class Board:
         """
         return self.board[row][col]
 
-    def draw_squares(self, win):
-        """Draw the alternating background squares onto ``win``.
-
-        Args:
-            win (pygame.Surface): Surface that receives the board background.
-
-        Returns:
-            None
-        """
-        win.fill(BLACK)
-        for row in range(ROWS):
-            for col in range(row % 2, COLS, 2):
-                pygame.draw.rect(win, PERU, (col*SQUARE_SIZE, row*SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
-    
     def move(self, piece, row, col):
         """Move ``piece`` to ``(row, col)`` and crown it if it reaches the far rank.
 
@@ -58,16 +88,83 @@ class Board:
         Returns:
             None
         """
+        origin, dest = square(piece.row, piece.col), square(row, col)
+        self._legal = (None, None)
         self.board[piece.row][piece.col], self.board[row][col] = self.board[row][col], self.board[piece.row][piece.col]
+        self.bits.move(origin, dest)
+        self.hash_key ^= piece_key(piece.color, piece.king, origin) ^ piece_key(piece.color, piece.king, dest)
+        if piece.color == WHITE:
+            self.positional -= WHITE_TABLE[dest] - WHITE_TABLE[origin]
+        else:
+            self.positional += DARKBLUE_TABLE[dest] - DARKBLUE_TABLE[origin]
         piece.move(row, col)
 
         if (row == ROWS - 1 or row == 0) and piece.king is False:
             piece.make_king()
+            self.bits.crown(dest)
+            self.hash_key ^= piece_key(piece.color, False, dest) ^ piece_key(piece.color, True, dest)
             if piece.color == WHITE:
                 self.white_kings += 1
             else:
                 self.darkblue_kings += 1
 
+    def make_move(self, move):
+        """Apply a move in place and return what is needed to undo it.
+
+        Args:
+            move (tuple[int, int, int, tuple]): Move record produced by ``legal_moves``.
+
+        Returns:
+            tuple: Undo record to be passed to ``unmake_move``.
+        """
+        origin, dest, captured, _ = move
+        grid = self.board
+        row, col = coords(origin)
+        piece = grid[row][col]
+        taken = ()
+        if captured:
+            taken = []
+            for sq in iter_squares(captured):
+                r, c = coords(sq)
+                taken.append(grid[r][c])
+        undo = (move, piece.king, taken, self.hash_key, self.positional, self.darkblue_left, self.white_left,
+                self.darkblue_kings, self.white_kings, self.reversible, self._legal)
+        self.history.append(self.hash_key)
+        self.reversible = self.reversible + 1 if piece.king and not captured else 0
+        self.move(piece, *coords(dest))
+        if taken:
+            self.remove(taken)
+        return undo
+
+    def unmake_move(self, undo):
+        """Revert a move applied by ``make_move``, restoring captures, promotion and counters.
+
+        Args:
+            undo (tuple): Record returned by ``make_move``.
+
+        Returns:
+            None
+        """
+        move, king, taken, self.hash_key, self.positional, self.darkblue_left, self.white_left, self.darkblue_kings, self.white_kings, self.reversible, legal = undo
+        self.history.pop()
+        origin, dest = move[0], move[1]
+        grid = self.board
+        for captured in taken:
+            grid[captured.row][captured.col] = captured
+            self.bits.place(captured.color, square(captured.row, captured.col), captured.king)
+
+        row, col = coords(origin)
+        drow, dcol = coords(dest)
+        piece = grid[drow][dcol]
+        grid[drow][dcol], grid[row][col] = grid[row][col], piece
+        self.bits.move(dest, origin)
+        piece.move(row, col)
+        if not king and piece.king:
+            piece.king = False
+            self.bits.kings &= ~(1 << origin)
+        # A posição voltou a ser a de antes da jogada, então as jogadas já geradas nela voltam a valer
+        self._legal = legal
+
     def create_board(self):
         """Populate the board with alternating empty squares and the starting pieces.
 
@@ -83,29 +180,17 @@ class Board:
                 if col % 2 == ((row + 1) % 2):
                     if row < 3:
                         self.board[row].append(Piece(AZUL_MARINHO, row, col))
+                        self.bits.place(AZUL_MARINHO, square(row, col))
                     elif row > 4:
                         self.board[row].append(Piece(WHITE, row, col))
+                        self.bits.place(WHITE, square(row, col))
                     else:
                         self.board[row].append(0)
                 else:
                     self.board[row].append(0)
+        self.hash_key = hash_position(self.bits)
+        self.positional = positional_score(self.bits)
     
-    def draw(self, win):
-        """Render the full board and all pieces onto ``win``.
-
-        Args:
-            win (pygame.Surface): Surface that receives the rendered board.
-
-        Returns:
-            None
-        """
-        self.draw_squares(win)
-        for row in range(ROWS):
-            for col in range(COLS):
-                piece = self.board[row][col]
-                if piece != 0:
-                    piece.draw(win)
-
     def remove(self, pieces):
         """Remove ``pieces`` after a capture and update piece counters.
 
@@ -115,17 +200,28 @@ class Board:
         Returns:
             None
         """
+        self._legal = (None, None)
         for piece in pieces:
             self.board[piece.row][piece.col] = 0
             if piece != 0:
+                sq = square(piece.row, piece.col)
+                self.bits.clear(1 << sq)
+                self.hash_key ^= piece_key(piece.color, piece.king, sq)
                 if piece.color == AZUL_MARINHO:
                     self.darkblue_left -= 1
+                    self.positional -= DARKBLUE_TABLE[sq]
                 else:
                     self.white_left -= 1
+                    self.positional += WHITE_TABLE[sq]
     
     def evaluate(self):
         """Return a heuristic score from the dark blue point of view.
 
+        Material and promotions come from the counters, the centre, advancement
+        and edge terms from ``positional`` (kept up to date by every move) and
+        the protection term from a few bitboard shifts, so the cost does not
+        depend on the number of pieces.
+
         Args:
             None
 
@@ -134,59 +230,16 @@ class Board:
         """
         score = 0
         
-        score += (self.darkblue_left - self.white_left) * 10
+        score += (self.darkblue_left - self.white_left) * MAN_VALUE
         
-        score += (self.darkblue_kings - self.white_kings) * 15
-        
-        for row in range(ROWS):
-            for col in range(COLS):
-                piece = self.board[row][col]
-                if piece != 0:
-                    position_value = 0
-                    
-                    # Peças no centro valem mais
-                    if 2 <= row <= 5 and 2 <= col <= 5:
-                        position_value += 3
-                    
-                    # Peças avançadas valem mais
-                    if piece.color == AZUL_MARINHO:
-                        position_value += row 
-                    else:
-                        position_value += (ROWS - 1 - row)  # 
+        score += (self.darkblue_kings - self.white_kings) * KING_BONUS
 
-                    if col == 0 or col == COLS - 1:
-                        position_value -= 2
-                    
+        score += self.positional
 
-                    if self._is_protected(piece, row, col):
-                        position_value += 2
-                    
-                    if piece.color == AZUL_MARINHO:
-                        score += position_value
-                    else:
-                        score -= position_value
+        # Peças com uma aliada na diagonal valem mais
+        score += (protected_count(self.bits.darkblue) - protected_count(self.bits.white)) * PROTECTION_BONUS
         return score
     
-    def _is_protected(self, piece, row, col):
-        """Return ``True`` if ``piece`` has a friendly neighbor diagonally adjacent.
-
-        Args:
-            piece (Piece): Piece being evaluated.
-            row (int): Piece row.
-            col (int): Piece column.
-
-        Returns:
-            bool: ``True`` if a friendly neighbor exists.
-        """
-        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        for dr, dc in directions:
-            r, c = row + dr, col + dc
-            if 0 <= r < ROWS and 0 <= c < COLS:
-                neighbor = self.board[r][c]
-                if neighbor != 0 and neighbor.color == piece.color:
-                    return True
-        return False
-    
     def get_pieces(self, color):
         """Return a list with all pieces of ``color`` still on the board.
 
@@ -197,11 +250,9 @@ class Board:
             list[Piece]: All pieces that match the color.
         """
         pieces = []
-        for row in self.board:
-            for piece in row:
-                if piece != 0 and piece.color == color: # A representação interna do quadrado vazio é 0
-                    # por isso fazemos essa verificação
-                    pieces.append(piece)
+        for sq in iter_squares(self.bits.side(color)): # Só visitamos as casas ocupadas pelo lado pedido
+            row, col = coords(sq)
+            pieces.append(self.board[row][col])
         return pieces
     
     
@@ -213,228 +264,136 @@ class Board:
             None
 
         Returns:
-            tuple | None: Color of the winner or ``None`` if game continues.
+            tuple | None: Color of the winner or ``None`` if both sides still have pieces.
         """
         if self.darkblue_left <= 0:
-            print("Brancas Vencem")
             return WHITE
         elif self.white_left <= 0:
-            print("Azul Marinho Vence")
             return AZUL_MARINHO
         return None
 
-    def get_valid_moves(self, piece, check_captures=True):
-        """Return every legal target square for ``piece`` and any captured pieces.
+    def outcome(self, color):
+        """Return the result of the game if it is over with ``color`` to move.
+
+        A side loses when it has no pieces or no legal move. The game is
+        drawn after ``DRAW_KING_PLIES`` consecutive king moves without a
+        capture, or when the same position appears for the third time with
+        the same side to move. Only bitboard tests and the hash history are
+        used, so it can be called at every node of the search.
 
         Args:
-            piece (Piece): Piece to evaluate.
-            check_captures (bool, optional): Whether to enforce the capture priority.
+            color (tuple): Color to move.
 
         Returns:
-            dict[tuple, list]: Mapping of (row, col) to a list of captured pieces.
+            tuple | str | None: Color of the winner, ``DRAW``, or ``None`` while the game goes on.
         """
-        moves = {}
-        left = piece.col - 1
-        right = piece.col + 1
-        row = piece.row
-
-        if piece.king:
-            moves.update(self.king_traverse_left(row -1, -1, -1, piece.color, left))
-            moves.update(self.king_traverse_right(row -1, -1, -1, piece.color, right))
-            moves.update(self.king_traverse_left(row +1, ROWS, 1, piece.color, left))
-            moves.update(self.king_traverse_right(row +1, ROWS, 1, piece.color, right))
-        if piece.color == WHITE:
-            moves.update(self._traverse_left(row -1, max(row-3, -1), -1, piece.color, left))
-            moves.update(self._traverse_right(row -1, max(row-3, -1), -1, piece.color, right))
-        if piece.color == AZUL_MARINHO:
-            moves.update(self._traverse_left(row +1, min(row+3, ROWS), 1, piece.color, left))
-            moves.update(self._traverse_right(row +1, min(row+3, ROWS), 1, piece.color, right))
-        
-        if check_captures:
-            possible_captures = self.check_possible_capture(piece.color)    
-            if possible_captures:
-                moves = {move: skipped for move, skipped in moves.items() if skipped}
-        
-        return moves
-        
-    def _traverse_left(self, start, stop, step, color, left, skipped=[]):
-        """Traverse diagonally left to find simple moves or multi-jump continuations.
+        winner = self.winner()
+        if winner is not None:
+            return winner
+        if self.reversible >= DRAW_KING_PLIES or self.repetitions() >= 3:
+            return DRAW
+        if not self.bits.has_move(color):
+            return AZUL_MARINHO if color == WHITE else WHITE
+        return None
+
+    def repetitions(self):
+        """Return how many times the current position has occurred with the same side to move.
+
+        Only the positions since the last capture or man move can repeat, so
+        the search goes back at most ``reversible`` plies.
 
         Args:
-            start (int): Starting row.
-            stop (int): Stopping row boundary (exclusive).
-            step (int): Row increment direction.
-            color (tuple): Color of the moving piece.
-            left (int): Starting column.
-            skipped (list, optional): Pieces captured so far in the path.
+            None
 
         Returns:
-            dict[tuple, list]: Candidate moves and their captured pieces.
+            int: Occurrences of the current position, counting this one.
         """
-        moves = {}
-        last = []
-        for r in range(start, stop, step):
-            if left < 0:
-                break
-            current = self.board[r][left]
-            if current == 0:
-                if skipped and not last:
-                    break
-                elif skipped:
-                    moves[(r, left)] = last + skipped
-                else:
-                    moves[(r, left)] = last
-                
-                if last:
-                    if step == -1:
-                        row = max(r-3, -1)
-                    else:
-                        row = min(r+3, ROWS)
-                    moves.update(self._traverse_left(r+step, row, step, color, left-1, skipped=last))
-                    moves.update(self._traverse_right(r+step, row, step, color, left+1, skipped=last))
-                break
-            elif current.color == color:
-                break
-            else:
-                last = [current]
-                    
-            left -= 1
-        return moves
-                
-    def _traverse_right(self, start, stop, step, color, right, skipped=[]):
-        """Traverse diagonally right to find simple moves or multi-jump continuations.
+        count = 1
+        history = self.history
+        oldest = len(history) - self.reversible
+        for index in range(len(history) - 2, max(oldest, 0) - 1, -2):
+            if history[index] == self.hash_key:
+                count += 1
+        return count
+
+    def legal_moves(self, color):
+        """Return every legal move of ``color``, generated for the whole side in one pass.
+
+        The mandatory-capture rule is checked once for the side: if any piece
+        can capture, only capture sequences are generated. Capture sequences
+        come from the precomputed diagonal tables in ``movegen`` and always run
+        to the end. The law of the majority is applied as the sequences come
+        in: only those that capture the most pieces, over all pieces of the
+        side, are kept. Sequences that differ only in the order of the jumps
+        (same origin, destination and captured pieces) lead to the same
+        position, so only the first one is kept. The result is cached until
+        the position changes (and restored by ``unmake_move``), so the search
+        and the UI can ask again for free.
 
         Args:
-            start (int): Starting row.
-            stop (int): Stopping row boundary (exclusive).
-            step (int): Row increment direction.
-            color (tuple): Color of the moving piece.
-            right (int): Starting column.
-            skipped (list, optional): Pieces captured so far in the path.
+            color (tuple): Color to move.
 
         Returns:
-            dict[tuple, list]: Candidate moves and their captured pieces.
+            list[tuple[int, int, int, tuple]]: Move records ``(origin, destination, captured mask,
+            path)``, where ``path`` lists the landing squares of a capture and is empty for a
+            simple move. The list is shared with the cache and must not be modified.
         """
-        moves = {}
-        last = []
-        for r in range(start, stop, step):
-            if right >= COLS:
-                break
-            current = self.board[r][right]
-            if current == 0:
-                if skipped and not last:
-                    break
-                elif skipped:
-                    moves[(r, right)] = last + skipped
-                else:
-                    moves[(r, right)] = last
-                
-                if last:
-                    if step == -1:
-                        row = max(r-3, -1)
-                    else:
-                        row = min(r+3, ROWS)
-                    moves.update(self._traverse_left(r+step, row, step, color, right-1, skipped=last))
-                    moves.update(self._traverse_right(r+step, row, step, color, right+1, skipped=last))
-                break
-            elif current.color == color:
-                break
-            else:
-                last = [current]
-                    
-            right += 1
+        if self._legal[0] == color:
+            return self._legal[1]
+
+        moves = generate_moves(self.bits, color)
+        self._legal = (color, moves)
         return moves
-    
-    def king_traverse_left(self, start, stop, step, color, left, skipped=[]):
-        """Traverse along the left diagonal for king pieces, allowing long moves.
+
+    def is_legal(self, move, color):
+        """Return ``True`` if ``move`` is a legal move of ``color`` here.
+
+        A simple move is checked straight on the bitboard, so a move taken
+        from a table can be tried without generating the whole side; a
+        capture is looked up among the generated moves.
 
         Args:
-            start (int): Starting row.
-            stop (int): Stopping row boundary.
-            step (int): Row increment direction.
-            color (tuple): Color of the king piece.
-            left (int): Starting column.
-            skipped (list, optional): Pieces captured so far in the path.
+            move (tuple): Move record, possibly from another position.
+            color (tuple): Color to move.
 
         Returns:
-            dict[tuple, list]: Candidate moves and their captured pieces.
+            bool: Whether ``move`` may be played.
         """
-        moves = {}
-        last = []
-        for r in range(start, stop, step):
-            if left < 0:
-                break
-            
-            current = self.board[r][left]
-            if current == 0:
-                if skipped and not last:
-                    break
-                elif skipped:
-                    moves[(r, left)] = last + skipped
-                else:
-                    moves[(r, left)] = last
+        if self._legal[0] == color or move[2]:
+            return move in self.legal_moves(color)
+        origin, dest, _, path = move
+        bits = self.bits
+        return (not path and bits.side(color) >> origin & 1 == 1 and not bits.has_capture(color)
+                and dest in bits.quiet_moves(origin))
 
-                if last:
-                    if step == -1:
-                        row = -1
-                    else:
-                        row = ROWS
-                    moves.update(self.king_traverse_left(r+step, row, step, color, left-1, skipped=last))
-                    moves.update(self.king_traverse_right(r+step, row, step, color, left+1, skipped=last))
-                    break
-            elif current.color == color:
-                break
-            else:
-                last = [current]
-            
-            left -= 1
-        return moves
-    
-    def king_traverse_right(self, start, stop, step, color, right, skipped=[]):
-        """Traverse along the right diagonal for king pieces, allowing long moves.
+    def get_valid_moves(self, piece, check_captures=True):
+        """Return every legal target square for ``piece`` and any captured pieces.
 
         Args:
-            start (int): Starting row.
-            stop (int): Stopping row boundary.
-            step (int): Row increment direction.
-            color (tuple): Color of the king piece.
-            right (int): Starting column.
-            skipped (list, optional): Pieces captured so far in the path.
+            piece (Piece): Piece to evaluate.
+            check_captures (bool, optional): Whether to enforce the capture priority.
 
         Returns:
-            dict[tuple, list]: Candidate moves and their captured pieces.
+            dict[tuple, list]: Mapping of (row, col) to a list of captured pieces.
         """
-        moves = {}
-        last = []
-        for r in range(start, stop, step):
-            if right >= COLS:
-                break
-            
-            current = self.board[r][right]
-            if current == 0:
-                if skipped and not last:
-                    break
-                elif skipped:
-                    moves[(r, right)] = last + skipped
-                else:
-                    moves[(r, right)] = last
+        sq = square(piece.row, piece.col)
+        if check_captures:
+            # Capturas com as mesmas casas de saída e chegada ficam com a primeira, na ordem de legal_moves
+            moves = {}
+            for origin, dest, captured, _ in self.legal_moves(piece.color):
+                if origin == sq:
+                    moves.setdefault(coords(dest), [self.get_piece(*coords(taken)) for taken in iter_squares(captured)])
+            return moves
 
-                if last:
-                    if step == -1:
-                        row = -1
-                    else:
-                        row = ROWS
-                    moves.update(self.king_traverse_left(r+step, row, step, color, right-1, skipped=last))
-                    moves.update(self.king_traverse_right(r+step, row, step, color, right+1, skipped=last))
-                    break
-            elif current.color == color:
-                break
-            else:
-                last = [current]
-            
-            right += 1
+        moves = {}
+        for path, captured in capture_sequences(self.bits, sq):
+            target = coords(path[-1])
+            if len(moves.get(target, ())) < captured.bit_count():
+                moves[target] = [self.get_piece(*coords(taken)) for taken in iter_squares(captured)]
+        for dest in self.bits.quiet_moves(sq):
+            moves.setdefault(coords(dest), [])
         return moves
-    
+
     def check_possible_capture(self, color):
         """Return ``True`` if any piece of ``color`` can capture an opponent.
 
@@ -444,11 +403,4 @@ class Board:
         Returns:
             bool: ``True`` if there is at least one capture available.
         """
-        for row in self.board:
-            for piece in row:
-                if piece != 0 and piece.color == color:
-                    valid_moves = self.get_valid_moves(piece, check_captures=False)
-                    for move, skipped in valid_moves.items():
-                        if skipped:
-                            return True
-        return False
+        return self.bits.has_capture(color)
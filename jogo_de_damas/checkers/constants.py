@@ -1,6 +1,5 @@
-import pygame
-
 # Esse arquivo define constantes usadas em todo o jogo de damas, como dimensões da janela, cores e tamanhos das peças.
+# Não importa o pygame: o motor (tabuleiro, geração de movimentos e busca) roda sem janela.
 
 WIDTH, HEIGHT = 800, 800
 ROWS, COLS = 8, 8
@@ -18,7 +17,8 @@ PERU = (205,133,63)
 SADDLE_BROWN = (139,69,19)
 LIGHT_YELLOW = (255, 255, 224)
 
+# Resultado de uma partida empatada (o vencedor é indicado pela cor)
+DRAW = "empate"
+
 # Cores para destaque
 GREEN_HIGHLIGHT = (144, 238, 144)
-
-CROWN = pygame.transform.scale(pygame.image.load('jogo_de_damas/assets/crown.png'), (44, 25))
\ No newline at end of file
@@ -0,0 +1,71 @@
+from .constants import ROWS, COLS
+from .bitboard import SQUARES, DIRECTIONS, coords, shift, iter_squares
+
+# Esse arquivo pré-calcula, para cada casa jogável, os termos posicionais da heurística de Board.evaluate
+# (centro, avanço e borda), para que o placar possa ser atualizado a cada jogada em vez de recalculado.
+
+MAN_VALUE = 10
+KING_BONUS = 15
+CENTER_BONUS = 3
+EDGE_PENALTY = 2
+PROTECTION_BONUS = 2
+
+
+def _square_value(sq, advancement):
+    """Return the centre, advancement and edge terms of a piece on ``sq``.
+
+    Args:
+        sq (int): Square index between 0 and 31.
+        advancement (Callable[[int], int]): Maps the row to the advancement bonus of the side.
+
+    Returns:
+        int: Positional value of the square, without the protection term.
+    """
+    row, col = coords(sq)
+    value = advancement(row)
+    # Peças no centro valem mais
+    if 2 <= row <= 5 and 2 <= col <= 5:
+        value += CENTER_BONUS
+    if col == 0 or col == COLS - 1:
+        value -= EDGE_PENALTY
+    return value
+
+
+# Peças avançadas valem mais: o azul marinho avança para baixo e as brancas para cima
+DARKBLUE_TABLE = [_square_value(sq, lambda row: row) for sq in range(SQUARES)]
+WHITE_TABLE = [_square_value(sq, lambda row: ROWS - 1 - row) for sq in range(SQUARES)]
+
+
+def positional_score(bits):
+    """Sum the square tables over a whole position, from the dark blue point of view.
+
+    ``Board`` only calls this when the position is built; afterwards it keeps
+    the sum up to date move by move.
+
+    Args:
+        bits (BitBoard): Position to score.
+
+    Returns:
+        int: Positive values favor dark blue, negative favor white.
+    """
+    score = 0
+    for sq in iter_squares(bits.darkblue):
+        score += DARKBLUE_TABLE[sq]
+    for sq in iter_squares(bits.white):
+        score -= WHITE_TABLE[sq]
+    return score
+
+
+def protected_count(own):
+    """Count the pieces of ``own`` that have a friendly piece diagonally adjacent.
+
+    Args:
+        own (int): Bitmask of one side.
+
+    Returns:
+        int: Number of protected pieces.
+    """
+    neighbours = 0
+    for direction in DIRECTIONS:
+        neighbours |= shift(own, direction)
+    return (own & neighbours).bit_count()
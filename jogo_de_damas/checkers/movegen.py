@@ -0,0 +1,128 @@
+from .bitboard import SQUARES, DIRECTIONS, WHITE_FORWARD, DARKBLUE_FORWARD, shift, iter_squares
+
+# Esse arquivo gera as sequências de captura a partir de tabelas de diagonais pré-calculadas,
+# usando uma pilha explícita em vez de recursão. As damas são voadoras, como nas regras brasileiras.
+
+
+def _build_rays():
+    """Precompute, for every square and direction, the squares along that diagonal.
+
+    Args:
+        None
+
+    Returns:
+        list[tuple[tuple[int, ...], ...]]: ``RAYS[sq][direction]`` lists the squares nearest first.
+    """
+    rays = []
+    for sq in range(SQUARES):
+        per_direction = []
+        for direction in DIRECTIONS:
+            ray = []
+            bit = shift(1 << sq, direction)
+            while bit:
+                ray.append(bit.bit_length() - 1)
+                bit = shift(bit, direction)
+            per_direction.append(tuple(ray))
+        rays.append(tuple(per_direction))
+    return rays
+
+
+RAYS = _build_rays()
+# Para os homens basta a casa vizinha e a casa de pouso logo atrás dela
+JUMPS = [tuple(ray[:2] if len(ray) >= 2 else None for ray in rays) for rays in RAYS]
+
+
+def capture_sequences(bits, sq):
+    """Return every complete capture sequence of the piece standing on ``sq``.
+
+    Men jump forward over an adjacent piece; kings slide over empty squares,
+    jump one piece and may land on any empty square behind it. A sequence
+    goes on while another capture is available from the landing square.
+    Captured pieces stay on the board until the sequence ends, so they can
+    neither be jumped twice nor passed through.
+
+    Args:
+        bits (BitBoard): Position to generate from.
+        sq (int): Square of the moving piece.
+
+    Returns:
+        list[tuple[tuple[int, ...], int]]: Landing squares in order (the last one is where the
+        piece stops) and mask of captured squares of every sequence.
+    """
+    bit = 1 << sq
+    white = bool(bits.white & bit)
+    opp = bits.darkblue if white else bits.white
+    king = bool(bits.kings & bit)
+    # A casa de origem fica livre assim que a peça começa a se mover
+    empty = bits.empty() | bit
+    directions = DIRECTIONS if king else (WHITE_FORWARD if white else DARKBLUE_FORWARD)
+
+    sequences = []
+    stack = [(sq, 0, ())]
+    while stack:
+        at, captured, path = stack.pop()
+        extended = False
+        for direction in directions:
+            if king:
+                ray = RAYS[at][direction]
+                index = 0
+                while index < len(ray) and empty >> ray[index] & 1:
+                    index += 1
+                if index + 1 >= len(ray):
+                    continue
+                over = ray[index]
+                if not opp >> over & 1 or captured >> over & 1:
+                    continue
+                taken = captured | 1 << over
+                for land in ray[index + 1:]:
+                    if not empty >> land & 1:
+                        break
+                    stack.append((land, taken, path + (land,)))
+                    extended = True
+            else:
+                jump = JUMPS[at][direction]
+                if jump is None:
+                    continue
+                over, land = jump
+                if opp >> over & 1 and not captured >> over & 1 and empty >> land & 1:
+                    stack.append((land, captured | 1 << over, path + (land,)))
+                    extended = True
+        if captured and not extended:
+            sequences.append((path, captured))
+    return sequences
+
+
+def generate_moves(bits, color):
+    """Return every legal move of ``color`` on ``bits``, applying mandatory capture and the law of the majority.
+
+    Args:
+        bits (BitBoard): Position to generate from.
+        color (tuple): Color to move.
+
+    Returns:
+        list[tuple[int, int, int, tuple]]: Move records ``(origin, destination, captured mask, path)``.
+    """
+    moves = []
+    if bits.has_capture(color):
+        most = 0
+        seen = set()
+        for sq in iter_squares(bits.side(color)):
+            for path, captured in capture_sequences(bits, sq):
+                count = captured.bit_count()
+                if count < most:
+                    continue
+                if count > most:
+                    # Lei da maioria: uma sequência maior descarta todas as anteriores
+                    most = count
+                    moves = []
+                    seen.clear()
+                key = (sq, path[-1], captured)
+                if key not in seen:
+                    seen.add(key)
+                    moves.append((sq, path[-1], captured, path))
+    else:
+        # Sem capturas disponíveis só restam os movimentos simples, gerados direto no bitboard
+        for sq in iter_squares(bits.side(color)):
+            for dest in bits.quiet_moves(sq):
+                moves.append((sq, dest, 0, ()))
+    return moves
@@ -0,0 +1,83 @@
+from .constants import ROWS, AZUL_MARINHO, WHITE
+from .bitboard import SQUARES, coords, iter_squares
+from .board import Board
+
+# Esse arquivo converte posições de/para uma notação de texto no estilo FEN do PDN, por exemplo "W:W21,22,K30:B1,2,K3".
+# As casas jogáveis são numeradas de 1 a 32 linha a linha a partir do topo; "W" são as brancas e "B" o azul marinho.
+
+_LETTERS = {WHITE: "W", AZUL_MARINHO: "B"}
+_COLORS = {"W": WHITE, "B": AZUL_MARINHO}
+
+
+def parse_position(text):
+    """Build a board from a FEN-style string.
+
+    Args:
+        text (str): Side to move followed by the piece list of each color, separated by ``:``.
+            Kings are prefixed with ``K``.
+
+    Returns:
+        tuple[Board, tuple]: The board and the color to move.
+
+    Raises:
+        ValueError: If the string is malformed, lists a square twice or puts a man on its
+            promotion row.
+    """
+    fields = text.strip().rstrip(".").split(":")
+    if not fields or fields[0] not in _COLORS:
+        raise ValueError(f"Posição inválida: {text!r}")
+    pieces = []
+    taken = set()
+    for field in fields[1:]:
+        if not field or field[0] not in _COLORS:
+            raise ValueError(f"Posição inválida: {text!r}")
+        color = _COLORS[field[0]]
+        for token in filter(None, field[1:].split(",")):
+            king = token.startswith("K")
+            number = int(token[1:] if king else token)
+            if not 1 <= number <= SQUARES:
+                raise ValueError(f"Casa fora do tabuleiro: {number}")
+            if number in taken:
+                raise ValueError(f"Casa ocupada duas vezes: {number}")
+            taken.add(number)
+            row, col = coords(number - 1)
+            # Um homem que chega à última fileira vira dama na hora, então não pode estar parado lá
+            if not king and row == (0 if color == WHITE else ROWS - 1):
+                raise ValueError(f"Homem na fileira de promoção: {number}")
+            pieces.append((color, row, col, king))
+    return Board.from_pieces(pieces), _COLORS[fields[0]]
+
+
+def position_text(board, color):
+    """Return the FEN-style string of ``board`` with ``color`` to move.
+
+    Args:
+        board (Board): Position to describe.
+        color (tuple): Color to move.
+
+    Returns:
+        str: Text accepted by ``parse_position``.
+    """
+    fields = [_LETTERS[color]]
+    for side in (WHITE, AZUL_MARINHO):
+        tokens = []
+        for sq in iter_squares(board.bits.side(side)):
+            prefix = "K" if board.bits.kings >> sq & 1 else ""
+            tokens.append(f"{prefix}{sq + 1}")
+        fields.append(_LETTERS[side] + ",".join(tokens))
+    return ":".join(fields)
+
+
+def move_text(move):
+    """Return ``move`` in PDN style, e.g. ``"22-18"`` or ``"26x17x10"``.
+
+    Args:
+        move (tuple[int, int, int, tuple]): Move record produced by ``Board.legal_moves``.
+
+    Returns:
+        str: Squares numbered from 1; a capture lists every landing square, joined by ``x``.
+    """
+    origin, dest, captured, path = move
+    if not captured:
+        return f"{origin + 1}-{dest + 1}"
+    return "x".join(str(sq + 1) for sq in (origin, *path))
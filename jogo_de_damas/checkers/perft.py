@@ -0,0 +1,32 @@
+from .constants import AZUL_MARINHO, WHITE
+
+# Esse arquivo conta os nós da árvore de jogadas até uma profundidade fixa (perft), usado para conferir a geração de movimentos
+# contra contagens conhecidas e medir sua velocidade.
+
+
+def perft(board, color, depth):
+    """Count the leaf positions reached after ``depth`` plies of legal moves.
+
+    The board is updated in place with ``make_move`` and restored with
+    ``unmake_move``, so it is left unchanged.
+
+    Args:
+        board (Board): Position to start from.
+        color (tuple): Color to move.
+        depth (int): Number of plies to play.
+
+    Returns:
+        int: Number of move sequences of exactly ``depth`` plies.
+    """
+    if depth == 0:
+        return 1
+    other = AZUL_MARINHO if color == WHITE else WHITE
+    moves = board.legal_moves(color)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        undo = board.make_move(move)
+        nodes += perft(board, other, depth - 1)
+        board.unmake_move(undo)
+    return nodes
@@ -1,12 +1,10 @@
-from .constants import *
-import pygame
-
-
 class Piece:
-    """Represents an individual checker piece and its rendering helpers."""
-    PADDING = 10
-    OUTLINE = 2
+    """Represents an individual checker piece on the board grid.
 
+    Only the grid position is stored; screen coordinates are computed by the
+    rendering code in ``gui``.
+    """
+    __slots__ = ("color", "row", "col", "king")
 
     def __init__(self, color, row, col):
         """Initialize a piece at ``(row, col)`` with the given ``color``.
@@ -23,21 +21,6 @@ class Piece:
         self.row = row
         self.col = col
         self.king = False
-        self.x = 0
-        self.y = 0
-        self.calc_pos()
-
-    def calc_pos(self):
-        """Update the screen coordinates according to the current row and column.
-
-        Args:
-            None
-
-        Returns:
-            None
-        """
-        self.x = SQUARE_SIZE * self.col + SQUARE_SIZE // 2
-        self.y = SQUARE_SIZE * self.row + SQUARE_SIZE // 2
 
     def make_king(self):
         """Promote the piece to king status.
@@ -50,23 +33,8 @@ class Piece:
         """
         self.king = True
     
-    def draw(self, win):
-        """Draw the piece on ``win`` including outline and crown if needed.
-
-        Args:
-            win (pygame.Surface): Surface onto which the piece is drawn.
-
-        Returns:
-            None
-        """
-        radius = SQUARE_SIZE // 2 - self.PADDING
-        pygame.draw.circle(win, LIGHT_YELLOW, (self.x, self.y), radius + self.OUTLINE)
-        pygame.draw.circle(win, self.color, (self.x, self.y), radius)
-        if self.king:
-            win.blit(CROWN, (self.x - CROWN.get_width() // 2, self.y - CROWN.get_height() // 2))
-
     def move(self, row, col):
-        """Update the grid position of the piece and recalculate pixel coordinates.
+        """Update the grid position of the piece.
 
         Args:
             row (int): New row.
@@ -77,7 +45,6 @@ class Piece:
         """
         self.row = row
         self.col = col
-        self.calc_pos()
 
     def __repr__(self):
         """Return the string representation of the piece color tuple.
@@ -0,0 +1,79 @@
+import random
+
+from .constants import WHITE
+from .bitboard import SQUARES, iter_squares
+
+# Esse arquivo gera as chaves de Zobrist usadas para identificar posições na tabela de transposição.
+# A semente é fixa para que a mesma posição tenha a mesma chave em qualquer processo.
+
+_rng = random.Random(0x5EED)
+
+# Uma chave por (tipo de peça, casa): homem azul marinho, dama azul marinho, homem branco, dama branca
+PIECE_KEYS = [[_rng.getrandbits(64) for _ in range(SQUARES)] for _ in range(4)]
+DARKBLUE_TO_MOVE = _rng.getrandbits(64)
+# Board.evaluate usa o número de promoções já feitas por cada lado, então ele também entra na chave usada pela busca
+PROMOTION_KEYS = [[_rng.getrandbits(64) for _ in range(SQUARES // 2 + 1)] for _ in range(2)]
+# Posições montadas à mão podem ter mais damas do que uma partida real chega a promover; as chaves que faltam são
+# sorteadas depois das outras, para que as já usadas (e o livro de aberturas gravado com elas) não mudem
+for _keys in PROMOTION_KEYS:
+    _keys.extend(_rng.getrandbits(64) for _ in range(SQUARES - SQUARES // 2))
+
+
+def piece_key(color, king, sq):
+    """Return the Zobrist key of a piece standing on ``sq``.
+
+    Args:
+        color (tuple): RGB tuple of the piece.
+        king (bool): Whether the piece is a king.
+        sq (int): Square index between 0 and 31.
+
+    Returns:
+        int: 64-bit key.
+    """
+    return PIECE_KEYS[(color == WHITE) * 2 + king][sq]
+
+
+def promotion_key(darkblue_kings, white_kings):
+    """Return the key that identifies how many promotions each side has made.
+
+    Args:
+        darkblue_kings (int): Promotions made by dark blue.
+        white_kings (int): Promotions made by white.
+
+    Returns:
+        int: 64-bit key.
+    """
+    return PROMOTION_KEYS[0][darkblue_kings] ^ PROMOTION_KEYS[1][white_kings]
+
+
+def position_key(board, max_player):
+    """Return the key of ``board`` with the side to move and the promotion counters folded in.
+
+    This is the key used by the transposition table and the opening book.
+
+    Args:
+        board (Board): Board whose Zobrist key is used.
+        max_player (bool): ``True`` if dark blue is to move.
+
+    Returns:
+        int: 64-bit key.
+    """
+    key = board.hash_key ^ promotion_key(board.darkblue_kings, board.white_kings)
+    return key ^ DARKBLUE_TO_MOVE if max_player else key
+
+
+def hash_position(bits):
+    """Compute the Zobrist key of a whole position from scratch.
+
+    Args:
+        bits (BitBoard): Position to hash.
+
+    Returns:
+        int: 64-bit key, equal to the one kept incrementally by ``Board``.
+    """
+    key = 0
+    for kind, mask in enumerate((bits.darkblue & ~bits.kings, bits.darkblue & bits.kings,
+                                 bits.white & ~bits.kings, bits.white & bits.kings)):
+        for sq in iter_squares(mask):
+            key ^= PIECE_KEYS[kind][sq]
+    return key
@@ -0,0 +1,27 @@
+import os
+
+import pygame
+
+# Esse arquivo carrega as imagens do jogo sob demanda: nada é lido do disco até a primeira vez que a janela desenha uma dama,
+# e o caminho é resolvido a partir deste módulo, e não do diretório de onde o jogo foi iniciado.
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+CROWN_SIZE = (44, 25)
+
+_crown = None
+
+
+def crown():
+    """Return the scaled crown image, loading it on the first call.
+
+    Args:
+        None
+
+    Returns:
+        pygame.Surface: Crown drawn on top of kings.
+    """
+    global _crown
+    if _crown is None:
+        image = pygame.image.load(os.path.join(ASSETS_DIR, "crown.png"))
+        _crown = pygame.transform.scale(image, CROWN_SIZE)
+    return _crown
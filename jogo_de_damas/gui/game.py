@@ -0,0 +1,219 @@
+import pygame
+
+from checkers.board import Board
+from checkers.bitboard import square, coords, iter_squares
+from checkers.constants import WHITE, AZUL_MARINHO
+from .overlay import StatsOverlay
+from .renderer import BoardRenderer
+
+# Esse arquivo controla a partida na janela: turnos, seleção de peças com o mouse e desenho do estado atual.
+
+class Game:
+    """High-level game controller that tracks turns and user interaction."""
+    def __init__(self, win):
+        """Store ``win`` surface and set the game to its initial state.
+
+        Args:
+            win (pygame.Surface): Surface that displays the game.
+
+        Returns:
+            None
+        """
+        self._init()
+        self.win = win
+        self.renderer = BoardRenderer(win)
+        self.overlay = StatsOverlay(win)
+        
+    def update(self):
+        """Repaint the squares that changed since the last frame and push only those areas to the screen.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        dirty = self.renderer.draw(self.board, self.valid_moves, self.captured)
+        dirty += self.overlay.draw(dirty)
+        if dirty:
+            pygame.display.update(dirty)
+    
+    def _init(self):
+        """Reset the board, selected piece, and turn trackers.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.selected = None
+        self.board = Board()
+        self.turn = WHITE
+        self.valid_moves = {}
+        self.choices = {}
+        self.shown = {}
+        self.captured = set()
+        
+    def winner(self):
+        """Return the result of the game if it is over, with the current player to move.
+
+        Args:
+            None
+
+        Returns:
+            tuple | str | None: Color tuple of the winner, ``DRAW`` or ``None`` otherwise.
+        """
+        return self.board.outcome(self.turn)
+    
+    def toggle_stats(self):
+        """Show or hide the panel with the statistics of the last AI search.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.overlay.toggle()
+        # Ao esconder o painel, as casas que estavam embaixo dele precisam ser redesenhadas
+        self.renderer.invalidate()
+
+    def reset(self):
+        """Restart the entire game.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._init()
+    
+    def select(self, row, col):
+        """Handle user selection logic and compute valid moves for that piece.
+
+        When two captures of the selected piece end on the same square, the
+        pieces taken by the one on show are marked; clicking another piece
+        that can be captured switches to a capture that takes it.
+
+        Args:
+            row (int): Row that was clicked.
+            col (int): Column that was clicked.
+
+        Returns:
+            bool: ``True`` if the selection is valid.
+        """
+        if self.selected:
+            if self._choose_capture(row, col):
+                return True
+            result = self.move(row, col)
+            if not result:
+                self.selected = None
+                self.select(row, col)
+        
+        piece = self.board.get_piece(row, col)
+        if piece != 0 and piece.color == self.turn:
+            self.selected = piece
+            origin = square(row, col)
+            self.choices = {}
+            for move in self.board.legal_moves(self.turn):
+                if move[0] == origin:
+                    self.choices.setdefault(coords(move[1]), []).append(move)
+            self._show({dest: moves[0] for dest, moves in self.choices.items()})
+            return True
+        return False
+
+    def _show(self, shown):
+        """Display one move per destination: the highlight and the pieces it captures.
+
+        Args:
+            shown (dict[tuple, tuple]): Move record on show for each destination.
+
+        Returns:
+            None
+        """
+        self.shown = shown
+        self.valid_moves = {
+            dest: [self.board.get_piece(*coords(taken)) for taken in iter_squares(move[2])]
+            for dest, move in shown.items()
+        }
+        self.captured = {coords(taken) for move in shown.values() for taken in iter_squares(move[2])}
+
+    def _choose_capture(self, row, col):
+        """Switch to the next capture that takes the piece on ``(row, col)``, if there is a choice.
+
+        Only destinations reached by more than one capture change; clicking
+        the same piece again cycles through every capture that takes it.
+
+        Args:
+            row (int): Row that was clicked.
+            col (int): Column that was clicked.
+
+        Returns:
+            bool: ``True`` if the click picked a capture.
+        """
+        bit = 1 << square(row, col)
+        shown = dict(self.shown)
+        picked = False
+        for dest, moves in self.choices.items():
+            start = moves.index(shown[dest])
+            for step in range(1, len(moves)):
+                move = moves[(start + step) % len(moves)]
+                if move[2] & bit:
+                    shown[dest] = move
+                    picked = True
+                    break
+        if picked:
+            self._show(shown)
+        return picked
+
+    def move(self, row, col):
+        """Move the currently selected piece to ``(row, col)`` when legal.
+
+        Args:
+            row (int): Destination row.
+            col (int): Destination column.
+
+        Returns:
+            bool: ``True`` if the move was performed.
+        """
+        if self.selected and (row, col) in self.valid_moves:
+            # Joga exatamente a captura que está na tela, pelo mesmo caminho da busca, para manter o histórico
+            # usado nas regras de empate
+            self.board.make_move(self.shown[(row, col)])
+            self.change_turn()
+        else:
+            return False
+        return True
+    
+    def change_turn(self):
+        """Switch the active player and clear cached moves.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.valid_moves = {}
+        self.choices = {}
+        self.shown = {}
+        self.captured = set()
+        if self.turn == AZUL_MARINHO:
+            self.turn = WHITE
+        else:
+            self.turn = AZUL_MARINHO
+            
+    def agent_movement(self, board):
+        """Update the internal board with an agent-produced state and pass the turn.
+
+        Args:
+            board (Board): New board instance returned by the AI.
+
+        Returns:
+            None
+        """
+        self.board = board
+        self.change_turn()
+        
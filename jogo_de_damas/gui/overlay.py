@@ -0,0 +1,130 @@
+import pygame
+
+from checkers.constants import BLACK, LIGHT_YELLOW
+from checkers.notation import move_text
+
+# Esse arquivo desenha, por cima do tabuleiro, um painel com as estatísticas da última busca da IA.
+# O painel tem tamanho fixo e fundo opaco, então basta copiá-lo de novo quando o conteúdo ou as casas embaixo mudam.
+
+FONT_SIZE = 22
+MARGIN = 8
+WIDTH = 420
+LINES = 6
+PV_MOVES = 8
+
+
+class StatsOverlay:
+    """Fixed panel in the window corner with the counters of the last AI search."""
+
+    def __init__(self, win):
+        """Start hidden and without statistics.
+
+        Args:
+            win (pygame.Surface): Window surface.
+
+        Returns:
+            None
+        """
+        self.win = win
+        self.visible = False
+        self.stats = None
+        self._font = None
+        self._panel = None
+
+    @property
+    def rect(self):
+        """Return the area of the window covered by the panel.
+
+        Args:
+            None
+
+        Returns:
+            pygame.Rect: Panel area in window coordinates.
+        """
+        return pygame.Rect(0, 0, WIDTH, LINES * FONT_SIZE + 2 * MARGIN)
+
+    def toggle(self):
+        """Show the panel if hidden and hide it otherwise.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.visible = not self.visible
+        self._panel = None
+
+    def set_stats(self, stats):
+        """Show ``stats`` on the next draw.
+
+        Args:
+            stats (SearchStats): Counters of the search that just finished.
+
+        Returns:
+            None
+        """
+        self.stats = stats
+        self._panel = None
+
+    def lines(self):
+        """Return the text lines of the panel.
+
+        Args:
+            None
+
+        Returns:
+            list[str]: One line per group of counters.
+        """
+        stats = self.stats
+        if stats is None:
+            return ["Sem busca ainda"]
+        score = "-" if stats.score is None else f"{stats.score:g}"
+        speed = stats.nodes / stats.seconds / 1000 if stats.seconds else 0.0
+        iterations = " ".join(f"{iteration['seconds']:.2f}" for iteration in stats.iterations[-5:])
+        line = " ".join(move_text(move) for move in stats.principal_variation[:PV_MOVES])
+        return [
+            f"profundidade {stats.depth}   ramificação {stats.branching_factor():.2f}   avaliação {score}",
+            f"nós {stats.nodes}   folhas {stats.leaves}   quiescência {stats.quiescence}",
+            f"cortes {stats.cutoffs}   tabela: {stats.table_hits} acertos, {stats.table_stores} gravações",
+            f"tempo {stats.seconds:.2f} s   {speed:.1f} mil nós/s",
+            f"iterações (s): {iterations}",
+            f"variante: {line}",
+        ]
+
+    def _render(self):
+        """Draw the panel surface for the current statistics.
+
+        Args:
+            None
+
+        Returns:
+            pygame.Surface: Opaque panel ready to be copied to the window.
+        """
+        if self._font is None:
+            pygame.font.init()
+            self._font = pygame.font.Font(None, FONT_SIZE)
+        panel = pygame.Surface(self.rect.size)
+        panel.fill(BLACK)
+        for index, text in enumerate(self.lines()[:LINES]):
+            panel.blit(self._font.render(text, True, LIGHT_YELLOW), (MARGIN, MARGIN + index * FONT_SIZE))
+        return panel
+
+    def draw(self, dirty):
+        """Copy the panel to the window when its content changed or the board was repainted under it.
+
+        Args:
+            dirty (list[pygame.Rect]): Areas the board renderer repainted this frame.
+
+        Returns:
+            list[pygame.Rect]: The panel area if it was drawn, otherwise an empty list.
+        """
+        if not self.visible:
+            return []
+        rect = self.rect
+        if self._panel is not None and rect.collidelist(dirty) == -1:
+            return []
+        if self._panel is None:
+            self._panel = self._render()
+        self.win.blit(self._panel, rect)
+        return [rect]
@@ -0,0 +1,95 @@
+import pygame
+
+from checkers.constants import BLACK, RED, ROWS, COLS, PERU, SQUARE_SIZE, LIGHT_YELLOW, GREEN_HIGHLIGHT
+from .assets import crown
+
+# Esse arquivo desenha o tabuleiro e as peças com o pygame; o motor em ``checkers`` não conhece nada de tela.
+# O fundo e as peças são desenhados uma única vez em superfícies guardadas, que depois só são copiadas (blit) para a janela.
+
+PADDING = 10
+OUTLINE = 2
+HIGHLIGHT_RADIUS = 15
+
+_sprites = {}
+
+
+def square_rect(row, col):
+    """Return the screen rectangle of the square ``(row, col)``.
+
+    Args:
+        row (int): Matrix row.
+        col (int): Matrix column.
+
+    Returns:
+        pygame.Rect: Area covered by the square.
+    """
+    return pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+
+
+def draw_squares(win):
+    """Draw the alternating background squares onto ``win``.
+
+    Args:
+        win (pygame.Surface): Surface that receives the board background.
+
+    Returns:
+        None
+    """
+    win.fill(BLACK)
+    for row in range(ROWS):
+        for col in range(row % 2, COLS, 2):
+            pygame.draw.rect(win, PERU, (col*SQUARE_SIZE, row*SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+
+
+def piece_sprite(color, king):
+    """Return the image of a piece, drawing it on the first request for that color and king state.
+
+    Args:
+        color (tuple): RGB tuple of the piece.
+        king (bool): Whether the crown is drawn on top.
+
+    Returns:
+        pygame.Surface: Transparent square-sized image with the piece centered.
+    """
+    sprite = _sprites.get((color, king))
+    if sprite is None:
+        sprite = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+        center = (SQUARE_SIZE // 2, SQUARE_SIZE // 2)
+        radius = SQUARE_SIZE // 2 - PADDING
+        pygame.draw.circle(sprite, LIGHT_YELLOW, center, radius + OUTLINE)
+        pygame.draw.circle(sprite, color, center, radius)
+        if king:
+            image = crown()
+            sprite.blit(image, (center[0] - image.get_width() // 2, center[1] - image.get_height() // 2))
+        _sprites[(color, king)] = sprite
+    return sprite
+
+
+def draw_highlight(win, row, col):
+    """Mark ``(row, col)`` as a valid destination.
+
+    Args:
+        win (pygame.Surface): Surface to draw on.
+        row (int): Matrix row.
+        col (int): Matrix column.
+
+    Returns:
+        None
+    """
+    center = (col * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2)
+    pygame.draw.circle(win, GREEN_HIGHLIGHT, center, HIGHLIGHT_RADIUS)
+
+
+def draw_capture_mark(win, row, col):
+    """Ring the piece on ``(row, col)`` as one that the shown capture takes.
+
+    Args:
+        win (pygame.Surface): Surface to draw on.
+        row (int): Matrix row.
+        col (int): Matrix column.
+
+    Returns:
+        None
+    """
+    center = (col * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2)
+    pygame.draw.circle(win, RED, center, SQUARE_SIZE // 2 - PADDING // 2, OUTLINE * 2)
@@ -0,0 +1,80 @@
+import pygame
+
+from checkers.constants import ROWS, COLS, WIDTH, HEIGHT
+from .render import square_rect, draw_squares, piece_sprite, draw_highlight, draw_capture_mark
+
+# Esse arquivo mantém o que está desenhado na janela e redesenha apenas as casas que mudaram desde o último quadro.
+
+
+class BoardRenderer:
+    """Draws a board onto a window, touching only the squares that changed."""
+
+    def __init__(self, win):
+        """Pre-render the static board and start with nothing drawn.
+
+        Args:
+            win (pygame.Surface): Window surface.
+
+        Returns:
+            None
+        """
+        self.win = win
+        self.background = pygame.Surface((WIDTH, HEIGHT))
+        draw_squares(self.background)
+        self.drawn = None
+
+    def invalidate(self):
+        """Force the next ``draw`` to repaint the whole window, e.g. after it was exposed again.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.drawn = None
+
+    def draw(self, board, valid_moves, captured=()):
+        """Repaint the squares whose piece or highlight changed since the previous call.
+
+        Args:
+            board (Board): Position to show.
+            valid_moves (dict): Destinations to highlight.
+            captured (Collection[tuple[int, int]], optional): Squares of the pieces the shown
+                capture takes.
+
+        Returns:
+            list[pygame.Rect]: Areas of the window that were repainted.
+        """
+        state = []
+        for row in range(ROWS):
+            for col in range(COLS):
+                piece = board.get_piece(row, col)
+                content = (piece.color, piece.king) if piece != 0 else None
+                state.append((content, (row, col) in valid_moves, (row, col) in captured))
+
+        if self.drawn is None:
+            # Primeiro quadro (ou janela exposta de novo): copia o fundo inteiro e marca tudo como alterado
+            self.win.blit(self.background, (0, 0))
+            changed = range(len(state))
+        else:
+            changed = [index for index, cell in enumerate(state) if cell != self.drawn[index]]
+
+        dirty = []
+        for index in changed:
+            row, col = divmod(index, COLS)
+            content, highlighted, taken = state[index]
+            rect = square_rect(row, col)
+            self.win.blit(self.background, rect, rect)
+            if content is not None:
+                self.win.blit(piece_sprite(*content), rect)
+            if highlighted:
+                draw_highlight(self.win, row, col)
+            if taken:
+                draw_capture_mark(self.win, row, col)
+            dirty.append(rect)
+
+        self.drawn = state
+        if len(dirty) == len(state):
+            return [self.win.get_rect()]
+        return dirty
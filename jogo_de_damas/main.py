@@ -3,11 +3,17 @@
 
 # Esse arquivo lida principalmente com a inicialização do Pygame, o loop principal do jogo e a captura de eventos do usuário.
 
+import os
+
 import pygame
 from checkers.constants import * 
 from checkers.board import Board
-from checkers.game import Game
-from minimax.agent import minimax
+from gui.game import Game
+from minimax.book import OpeningBook
+from minimax.searchlog import SearchLog
+from minimax.tablebase import Tablebase
+from minimax.transposition import TranspositionTable
+from minimax.worker import SearchWorker
 
 
 FPS = 60
@@ -15,7 +21,14 @@ WIN = pygame.display.set_mode((WIDTH, HEIGHT))
 game = Game(WIN)
 AI_COLOR = AZUL_MARINHO
 AI_MAX_PLAYER = AI_COLOR == AZUL_MARINHO
-AI_DEPTH = 3
+AI_TIME_LIMIT = 1.0 # segundos por jogada da IA
+AI_TABLE_SIZE = 1 << 16
+AI_POLL_INTERVAL = 50 # ms entre as verificações do resultado da IA
+AI_STATS_LOG = None # caminho de um arquivo JSONL para gravar as estatísticas de cada busca, ou None
+AI_BOOK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "abertura.bin") # gerado por build_book.py
+AI_TABLEBASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "finais.bin") # gerado por build_tablebase.py
+AI_PONDER = True # a IA continua pensando na vez do jogador, a partir da resposta que ela espera
+SHOW_STATS = False # painel de estatísticas da busca; a tecla S mostra/esconde durante a partida
 
 def get_row_and_column_from_mpos(pos):
         """Return the board coordinates that correspond to the mouse position.
@@ -33,6 +46,8 @@ def get_row_and_column_from_mpos(pos):
 
 
 pygame.display.set_caption('Jogo de Damas')
+# O movimento do mouse não muda nada na tela, então não precisa acordar o loop
+pygame.event.set_blocked(pygame.MOUSEMOTION)
 
 def main():
     """Initialize pygame and run the event loop until the window is closed.
@@ -47,26 +62,62 @@ def main():
     clock = pygame.time.Clock()
     board = Board()
     game = Game(WIN)
+    log = SearchLog(AI_STATS_LOG) if AI_STATS_LOG else None
+    # O livro e as tabelas de finais são só mapeados em memória: abrir não lê os arquivos, então não atrasa a janela
+    book = OpeningBook(AI_BOOK) if os.path.exists(AI_BOOK) else None
+    tablebase = Tablebase(AI_TABLEBASE) if os.path.exists(AI_TABLEBASE) else None
+    worker = SearchWorker(AI_TIME_LIMIT, table=TranspositionTable(AI_TABLE_SIZE), log=log, book=book, tablebase=tablebase)
+    if SHOW_STATS:
+        game.toggle_stats()
 
     while run:
         clock.tick(FPS)
         if game.turn == AI_COLOR and game.winner() is None:
-            _, new_board = minimax(game.board, AI_DEPTH, AI_MAX_PLAYER, game)
-            game.agent_movement(new_board)
+            # A busca roda em outra thread; a jogada só é aplicada quando o resultado chega
+            result = worker.poll()
+            if result is not None:
+                game.agent_movement(result[1])
+                game.overlay.set_stats(worker.stats)
+                if AI_PONDER and game.winner() is None:
+                    worker.ponder(game.board, AI_MAX_PLAYER)
+            elif worker.pondering or not worker.running:
+                # Se o jogador fez o lance previsto, a busca da ponderação continua valendo para esta jogada
+                worker.start(game.board, AI_MAX_PLAYER)
         
-        if game.winner() != None:
-            print(f"{game.winner()} venceu!")
+        result = game.winner()
+        if result == DRAW:
+            print("Empate!")
+            run = False
+        elif result is not None:
+            print(f"{'Brancas' if result == WHITE else 'Azul Marinho'} venceu!")
             run = False
 
-        for event in pygame.event.get():
+        game.update()
+        events = pygame.event.get()
+        if run and not events:
+            # Sem eventos, o loop dorme até o próximo; na vez da IA acorda de tempos em tempos para buscar o resultado
+            events = [pygame.event.wait(AI_POLL_INTERVAL if game.turn == AI_COLOR else 0)]
+
+        for event in events:
             if event.type == pygame.QUIT:
                 run = False
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEBUTTONDOWN and game.turn != AI_COLOR:
                 pos = pygame.mouse.get_pos()
                 row, col = get_row_and_column_from_mpos(pos)
                 game.select(row, col)
-                
-        game.update()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_s:
+                game.toggle_stats()
+            if event.type == pygame.WINDOWEXPOSED:
+                game.renderer.invalidate()
+    # A ponderação pode estar rodando mesmo com a partida encerrada; ela consulta o livro, as tabelas e o log, então
+    # a thread precisa terminar antes que eles sejam fechados
+    worker.cancel()
+    if log is not None:
+        log.close()
+    if book is not None:
+        book.close()
+    if tablebase is not None:
+        tablebase.close()
     pygame.quit()
 
 main()
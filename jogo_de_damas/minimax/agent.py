@@ -1,63 +1,582 @@
+import sys
+import time
 from copy import deepcopy
 
-from checkers.constants import AZUL_MARINHO, WHITE
+from checkers.constants import AZUL_MARINHO, WHITE, DRAW
+from checkers.zobrist import position_key
+from .budget import SearchBudget, SearchTimeout
+from .movepicker import MovePicker
+from .ordering import MoveOrdering
+from .stats import SearchStats
+from .transposition import EXACT, LOWER, UPPER, TranspositionTable
 
+MAX_DEPTH = 64
+QUIESCENCE_NODES = 200 # nós de quiescência por folha da busca principal
+DRAW_SCORE = 0
+# Fim de jogo a ``ply`` lances da raiz vale WIN_SCORE - ply: bem acima de qualquer avaliação heurística, e as vitórias
+# mais curtas (e as derrotas mais longas) são as preferidas
+WIN_SCORE = 10000
+# Pontuações a partir daqui só vêm de partidas terminadas
+FORCED_WIN = WIN_SCORE // 2
 
-def minimax(position, depth, max_player, game):
-    """Run the minimax search on ``position`` until ``depth`` or terminal.
+
+class _Context:
+    """State shared by every node of a single search."""
+    __slots__ = ("game", "stats", "ordering", "table", "budget", "quiescence", "quiescence_left", "tablebase")
+
+    def __init__(self, game, stats, ordering, table, budget, quiescence=QUIESCENCE_NODES, tablebase=None):
+        """Bundle the per-search objects so the recursion only carries one reference.
+
+        Args:
+            game (Game): Game instance, currently unused.
+            stats (SearchStats): Counters updated during the search.
+            ordering (MoveOrdering): Move-ordering heuristics.
+            table (TranspositionTable | None): Transposition table, if any.
+            budget (SearchBudget | None): Limits checked at every node, if any.
+            quiescence (int, optional): Quiescence nodes allowed below each leaf; 0 disables it.
+            tablebase (Tablebase, optional): Endgame tables probed at every node.
+
+        Returns:
+            None
+        """
+        self.game = game
+        self.stats = stats
+        self.ordering = ordering
+        self.table = table
+        self.budget = budget
+        self.quiescence = quiescence
+        self.quiescence_left = 0
+        self.tablebase = tablebase
+
+
+def minimax(position, depth, max_player, game, stats=None, ordering=None, table=None, quiescence=QUIESCENCE_NODES,
+            tablebase=None):
+    """Run an alpha-beta minimax search on ``position`` until ``depth`` or terminal.
+
+    The whole tree is walked on ``position`` itself through make/unmake, so
+    the board is left exactly as it was once the search returns. Moves are
+    tried in the order given by ``ordering``, but ties at the root are broken
+    by generation order so the chosen move is the same as a plain minimax.
 
     Args:
         position (Board): Current board state to explore from.
         depth (int): Remaining search depth.
         max_player (bool): ``True`` if it is the AI (dark blue) turn.
         game (Game): Game instance, currently unused but kept for future hooks.
+        stats (SearchStats, optional): Receives the node, cutoff and table
+            counters, the time spent and the principal variation.
+        ordering (MoveOrdering, optional): Killer and history tables to reuse.
+        table (TranspositionTable, optional): Table shared across searches. Its
+            scores are only reused at the same remaining depth, so the result
+            is the same with or without it.
+        quiescence (int, optional): Quiescence nodes allowed below each leaf; 0
+            evaluates leaves directly.
+        tablebase (Tablebase, optional): Endgame tables; positions they cover
+            are scored exactly instead of searched.
+
+    Returns:
+        tuple[int, Board]: Evaluation score and the associated board state.
+    """
+    started = time.perf_counter()
+    context = _Context(game, stats or SearchStats(), ordering or MoveOrdering(), table, None, quiescence, tablebase)
+    if table is not None:
+        table.new_search()
+
+    score = terminal_score(position, max_player)
+    if score is not None:
+        context.stats.nodes += 1
+        return score, position
+    if depth == 0:
+        # Sem jogadas para escolher, a raiz é uma folha como qualquer outra: as capturas pendentes são resolvidas
+        return _search(position, 0, float("-inf"), float("inf"), max_player, context, 0), position
+
+    nodes = context.stats.nodes
+    evaluation, best_move = _root(position, depth, max_player, context)
+    if table is not None:
+        line = principal_variation(position, max_player, table, depth)
+    else:
+        line = [best_move] if best_move is not None else []
+    seconds = time.perf_counter() - started
+    context.stats.add_iteration(depth, context.stats.nodes - nodes, seconds, evaluation, line)
+    context.stats.seconds += seconds
+    return evaluation, play_move(position, best_move)
+
+
+def window_search(position, depth, alpha, beta, max_player, ply, table=None, quiescence=QUIESCENCE_NODES):
+    """Score ``position`` with a fail-soft alpha-beta search inside ``(alpha, beta)``.
+
+    This is the search ``minimax`` runs below the root, for callers that
+    split the root moves themselves. A score above ``alpha`` and below
+    ``beta`` is exact; otherwise it is only a bound on that side.
+
+    Args:
+        position (Board): Board that is modified and restored in place.
+        depth (int): Remaining search depth.
+        alpha (float): Score the maximizer is already assured of.
+        beta (float): Score the minimizer is already assured of.
+        max_player (bool): ``True`` if dark blue is to move.
+        ply (int): Distance from the root, which game-ending scores are counted from.
+        table (TranspositionTable, optional): Table shared across searches.
+        quiescence (int, optional): Quiescence nodes allowed below each leaf; 0
+            evaluates leaves directly.
+
+    Returns:
+        float: Evaluation score of ``position``.
+    """
+    context = _Context(None, SearchStats(), MoveOrdering(), table, None, quiescence)
+    if table is not None:
+        table.new_search()
+    return _search(position, depth, alpha, beta, max_player, context, ply)
+
+
+def iterative_deepening(position, max_player, game, time_limit=None, node_limit=None, max_depth=MAX_DEPTH,
+                        stats=None, ordering=None, table=None, budget=None, quiescence=QUIESCENCE_NODES,
+                        tablebase=None):
+    """Search ``position`` one ply deeper at a time until the budget runs out.
+
+    Each iteration is a full ``minimax`` search that starts with the
+    principal variation of the previous one. An iteration interrupted by the
+    budget is thrown away, so the move returned always comes from the deepest
+    completed depth. The first iteration always completes unless the search
+    is cancelled through ``budget``. A root position covered by
+    ``tablebase`` is answered from the tables without searching.
+
+    Args:
+        position (Board): Current board state to explore from.
+        max_player (bool): ``True`` if it is the AI (dark blue) turn.
+        game (Game): Game instance, currently unused but kept for future hooks.
+        time_limit (float, optional): Seconds available for the move.
+        node_limit (int, optional): Nodes available for the move.
+        max_depth (int, optional): Deepest iteration to try.
+        stats (SearchStats, optional): Receives the counters, the depth reached,
+            the time and nodes of every completed iteration and the principal variation.
+        ordering (MoveOrdering, optional): Killer and history tables to reuse.
+        table (TranspositionTable, optional): Table shared across searches; a
+            private one is used when omitted.
+        budget (SearchBudget, optional): Budget to use instead of building one
+            from ``time_limit`` and ``node_limit``, so another thread can
+            cancel the search.
+        quiescence (int, optional): Quiescence nodes allowed below each leaf; 0
+            evaluates leaves directly.
+        tablebase (Tablebase, optional): Endgame tables probed at the root and
+            at every node.
 
     Returns:
         tuple[int, Board]: Evaluation score and the associated board state.
     """
-    if depth == 0 or position.winner() is not None:
-        return position.evaluate(), position
+    if budget is None:
+        budget = SearchBudget(time_limit, node_limit)
+    budget.start()
+    budget.armed = False
+    context = _Context(game, stats or SearchStats(), ordering or MoveOrdering(), table or TranspositionTable(), budget,
+                       quiescence, tablebase)
+    context.table.new_search()
+
+    score = terminal_score(position, max_player)
+    if score is not None:
+        context.stats.nodes += 1
+        return score, position
+
+    stats = context.stats
+    entry = tablebase.best_move(position, max_player) if tablebase is not None else None
+    if entry is not None:
+        move, result, distance = entry
+        score = _tablebase_score(result, distance, max_player, 0)
+        stats.nodes += 1
+        stats.add_iteration(1, 1, budget.elapsed(), score, [move])
+        stats.seconds += budget.elapsed()
+        return score, play_move(position, move)
+
+    evaluation, best_move = None, None
+    for depth in range(1, max_depth + 1):
+        nodes, started = stats.nodes, time.perf_counter()
+        try:
+            evaluation, best_move = _root(position, depth, max_player, context)
+        except SearchTimeout:
+            break
+        line = principal_variation(position, max_player, context.table, depth)
+        stats.add_iteration(depth, stats.nodes - nodes, time.perf_counter() - started, evaluation, line)
+        context.ordering.principal_variation = line
+        budget.armed = True
+        if best_move is None or abs(evaluation) >= FORCED_WIN:
+            break
+    stats.seconds += budget.elapsed()
+    return evaluation, play_move(position, best_move)
+
+
+def principal_variation(position, max_player, table, depth):
+    """Follow the best moves stored in ``table`` starting from ``position``.
+
+    Args:
+        position (Board): Root of the line; it is left unchanged.
+        max_player (bool): ``True`` if dark blue is to move at the root.
+        table (TranspositionTable): Table filled by a previous search.
+        depth (int): Longest line to return.
+
+    Returns:
+        list[tuple]: Every move record of the line.
+    """
+    line = []
+    undos = []
+    seen = set()
+    try:
+        while len(line) < depth:
+            key = position_key(position, max_player)
+            entry = table.probe(key)
+            if entry is None or entry.move is None or key in seen:
+                break
+            seen.add(key)
+            color = AZUL_MARINHO if max_player else WHITE
+            if entry.move not in position.legal_moves(color):
+                break
+            line.append(entry.move)
+            undos.append(simulate_move(entry.move, position))
+            max_player = not max_player
+    finally:
+        for undo in reversed(undos):
+            position.unmake_move(undo)
+    return line
+
+
+def play_move(position, move):
+    """Return a copy of ``position`` with ``move`` applied.
+
+    Args:
+        position (Board): Board the move belongs to; it is left unchanged.
+        move (tuple | None): Move returned by ``get_all_moves``.
+
+    Returns:
+        Board | None: New board, or ``None`` when there is no move.
+    """
+    if move is None:
+        return None
+    undo = simulate_move(move, position)
+    new_board = deepcopy(position)
+    position.unmake_move(undo)
+    return new_board
+
+
+def terminal_score(position, max_player, ply=0):
+    """Return the score of ``position`` if the game is over there, or ``None`` otherwise.
+
+    A side left without pieces and a side that cannot move lose alike, with
+    ``WIN_SCORE`` less the distance from the root, so the search prefers the
+    quickest win and the slowest loss. Draws score ``DRAW_SCORE``.
+
+    Args:
+        position (Board): Position to test; its move history is used for repetitions.
+        max_player (bool): ``True`` if dark blue is to move.
+        ply (int, optional): Distance from the root.
+
+    Returns:
+        int | None: Terminal score from the dark blue point of view, or ``None``.
+    """
+    outcome = position.outcome(AZUL_MARINHO if max_player else WHITE)
+    if outcome is None:
+        return None
+    if outcome == DRAW:
+        return DRAW_SCORE
+    return WIN_SCORE - ply if outcome == AZUL_MARINHO else ply - WIN_SCORE
+
+
+def _tablebase_score(result, distance, max_player, ply):
+    """Turn a tablebase result into a search score from the dark blue point of view.
+
+    Args:
+        result (int): ``WIN``, ``DRAW`` or ``LOSS`` for the side to move.
+        distance (int): Plies to the end of the game.
+        max_player (bool): ``True`` if dark blue is to move.
+        ply (int): Distance from the root, so nearer wins score higher.
+
+    Returns:
+        int: Score of the position.
+    """
+    if not result:
+        return DRAW_SCORE
+    # Mesma escala das partidas terminadas: a tabela diz em quantos lances, a partir deste nó, o jogo acaba
+    score = (WIN_SCORE - ply - distance) * result
+    return score if max_player else -score
+
+
+def _to_table(score, ply):
+    """Make a game-ending score relative to the node before it goes into the transposition table.
+
+    Such scores count the plies from the root, and the same position may be
+    reached again at another ply; the table keeps the distance from the node
+    itself instead.
+
+    Args:
+        score (float): Score counted from the root.
+        ply (int): Distance of the node from the root.
+
+    Returns:
+        float: Score counted from the node.
+    """
+    if score >= FORCED_WIN:
+        return score + ply
+    if score <= -FORCED_WIN:
+        return score - ply
+    return score
+
+
+def _from_table(score, ply):
+    """Undo ``_to_table`` for a node found at ``ply``.
+
+    Args:
+        score (float): Score read from the transposition table.
+        ply (int): Distance of the node from the root.
+
+    Returns:
+        float: Score counted from the root.
+    """
+    if score >= FORCED_WIN:
+        return score - ply
+    if score <= -FORCED_WIN:
+        return score + ply
+    return score
+
+
+def _tie_bound(value, max_player):
+    """Return the window edge that lets a move generated earlier win a tie with ``value``.
+
+    Args:
+        value (float): Score of the current best root move.
+        max_player (bool): ``True`` if the root maximizes.
 
+    Returns:
+        float: Bound just below (or above, for the minimizer) ``value``.
+    """
     if max_player:
-        max_eval = float("-inf")
-        best_move = None
-        for move in get_all_moves(position, AZUL_MARINHO, game):
-            evaluation = minimax(move, depth - 1, False, game)[0]
-            if evaluation > max_eval:
-                max_eval = evaluation
-                best_move = move
-        return max_eval, best_move
-
-    min_eval = float("inf")
+        return value - 1 if value != float("inf") else sys.float_info.max
+    return value + 1 if value != float("-inf") else -sys.float_info.max
+
+
+def _table_move(table, key):
+    """Return the best move stored in ``table`` for ``key``, if any.
+
+    Args:
+        table (TranspositionTable | None): Table to probe.
+        key (int): Transposition key of the position.
+
+    Returns:
+        tuple | None: Stored move.
+    """
+    if table is None:
+        return None
+    entry = table.probe(key)
+    return entry.move if entry is not None else None
+
+
+def _root(position, depth, max_player, context):
+    """Search every root move and pick the first generated one with the best score.
+
+    Args:
+        position (Board): Board that is modified and restored in place.
+        depth (int): Remaining search depth.
+        max_player (bool): ``True`` if it is the AI (dark blue) turn.
+        context (_Context): Objects shared by the whole search.
+
+    Returns:
+        tuple[int, tuple | None]: Evaluation score and the best move found.
+    """
+    context.stats.nodes += 1
+    table = context.table
+    color = AZUL_MARINHO if max_player else WHITE
+    key = position_key(position, max_player)
+    moves = context.ordering.order(get_all_moves(position, color, context.game), 0, _table_move(table, key),
+                                   position.bits.kings)
+    best_eval = float("-inf") if max_player else float("inf")
+    best_index = None
+    best_move = None
+    for index, move in moves:
+        bound = best_eval
+        if best_move is not None and index < best_index:
+            bound = _tie_bound(best_eval, max_player)
+
+        undo = simulate_move(move, position)
+        try:
+            if max_player:
+                evaluation = _search(position, depth - 1, bound, float("inf"), False, context, 1)
+                better = evaluation > bound
+            else:
+                evaluation = _search(position, depth - 1, float("-inf"), bound, True, context, 1)
+                better = evaluation < bound
+        finally:
+            position.unmake_move(undo)
+
+        # Mesmo quando todas as jogadas perdem, a raiz precisa devolver uma delas
+        if better or best_move is None:
+            best_eval = evaluation
+            best_index = index
+            best_move = move
+
+    if table is not None and best_move is not None and table.store(key, depth, EXACT, best_eval, best_move):
+        context.stats.table_stores += 1
+    return best_eval, best_move
+
+
+def _search(position, depth, alpha, beta, max_player, context, ply):
+    """Recursive fail-soft alpha-beta over a single mutable board.
+
+    Args:
+        position (Board): Board that is modified and restored in place.
+        depth (int): Remaining search depth.
+        alpha (float): Score the maximizer is already assured of.
+        beta (float): Score the minimizer is already assured of.
+        max_player (bool): ``True`` if it is the AI (dark blue) turn.
+        context (_Context): Objects shared by the whole search.
+        ply (int): Distance from the root.
+
+    Returns:
+        int: Evaluation score of ``position``.
+
+    Raises:
+        SearchTimeout: If the search budget runs out.
+    """
+    stats = context.stats
+    stats.nodes += 1
+    if context.budget is not None:
+        context.budget.check(stats.nodes)
+    score = terminal_score(position, max_player, ply)
+    if score is not None:
+        return score
+    if context.tablebase is not None:
+        entry = context.tablebase.probe_position(position, max_player)
+        if entry is not None:
+            stats.tablebase_hits += 1
+            return _tablebase_score(*entry, max_player, ply)
+    if depth == 0:
+        if context.quiescence:
+            context.quiescence_left = context.quiescence
+            return _quiescence(position, alpha, beta, max_player, context, ply)
+        stats.leaves += 1
+        return position.evaluate()
+
+    key = position_key(position, max_player)
+    table = context.table
+    hash_move = None
+    if table is not None:
+        entry = table.probe(key)
+        if entry is not None:
+            stats.table_hits += 1
+            hash_move = entry.move
+            if entry.depth == depth:
+                stored = _from_table(entry.score, ply)
+                if entry.flag == EXACT:
+                    return stored
+                if entry.flag == LOWER:
+                    alpha = max(alpha, stored)
+                else:
+                    beta = min(beta, stored)
+                if alpha >= beta:
+                    return stored
+
+    color = AZUL_MARINHO if max_player else WHITE
+    ordering = context.ordering
+    # As jogadas vêm em etapas: se a da tabela ou a da variante principal cortar, o resto nem chega a ser gerado
+    moves = MovePicker(position, color, ordering, ply, hash_move)
+    window = alpha, beta
+    best_eval = float("-inf") if max_player else float("inf")
     best_move = None
-    for move in get_all_moves(position, WHITE, game):
-        evaluation = minimax(move, depth - 1, True, game)[0]
-        if evaluation < min_eval:
-            min_eval = evaluation
+    for searched, move in enumerate(moves, 1):
+        undo = simulate_move(move, position)
+        try:
+            evaluation = _search(position, depth - 1, alpha, beta, not max_player, context, ply + 1)
+        finally:
+            position.unmake_move(undo)
+
+        if max_player and evaluation > best_eval or not max_player and evaluation < best_eval:
+            best_eval = evaluation
             best_move = move
-    return min_eval, best_move
+        if max_player:
+            alpha = max(alpha, best_eval)
+        else:
+            beta = min(beta, best_eval)
+        if alpha >= beta:
+            stats.cutoffs += 1
+            stats.pruned += moves.generated - searched
+            ordering.cutoff(move, ply, depth)
+            break
+
+    if table is not None:
+        if best_eval <= window[0]:
+            flag = UPPER
+        elif best_eval >= window[1]:
+            flag = LOWER
+        else:
+            flag = EXACT
+        if table.store(key, depth, flag, _to_table(best_eval, ply), best_move):
+            stats.table_stores += 1
+    return best_eval
+
+
+def _quiescence(position, alpha, beta, max_player, context, ply):
+    """Extend a leaf through the pending captures until the position is quiet.
+
+    Captures are mandatory, so there is no "stand pat": while the side to
+    move can capture, every capture is searched. Only the leaf's own node
+    allowance (``context.quiescence_left``) stops the extension early, in
+    which case the position is evaluated as it stands.
+
+    Args:
+        position (Board): Board that is modified and restored in place.
+        alpha (float): Score the maximizer is already assured of.
+        beta (float): Score the minimizer is already assured of.
+        max_player (bool): ``True`` if dark blue is to move.
+        context (_Context): Objects shared by the whole search.
+        ply (int): Distance from the root.
+
+    Returns:
+        int: Evaluation score of ``position`` once the captures are resolved.
+    """
+    score = terminal_score(position, max_player, ply)
+    if score is not None:
+        return score
+    stats = context.stats
+    color = AZUL_MARINHO if max_player else WHITE
+    if context.quiescence_left <= 0 or not position.bits.has_capture(color):
+        stats.leaves += 1
+        return position.evaluate()
+    context.quiescence_left -= 1
+    stats.quiescence += 1
+
+    # As capturas mais longas primeiro costumam provocar os cortes mais cedo
+    moves = sorted(position.legal_moves(color), key=lambda move: -move[2].bit_count())
+    best_eval = float("-inf") if max_player else float("inf")
+    for move in moves:
+        undo = simulate_move(move, position)
+        try:
+            evaluation = _quiescence(position, alpha, beta, not max_player, context, ply + 1)
+        finally:
+            position.unmake_move(undo)
+
+        if max_player:
+            best_eval = max(best_eval, evaluation)
+            alpha = max(alpha, best_eval)
+        else:
+            best_eval = min(best_eval, evaluation)
+            beta = min(beta, best_eval)
+        if alpha >= beta:
+            stats.cutoffs += 1
+            break
+    return best_eval
 
 
-def simulate_move(piece, move, board, skipped):
-    """Apply ``move`` to ``piece`` on ``board`` and remove any ``skipped`` pieces.
+def simulate_move(move, board):
+    """Apply ``move`` on ``board`` in place.
 
     Args:
-        piece (Piece): Piece to move on the board.
-        move (tuple[int, int]): Target row and column for the move.
+        move (tuple): Move record, as produced by ``Board.legal_moves``.
         board (Board): Board to apply the move on (modified in place).
-        skipped (list[Piece]): Captured pieces to remove, if any.
 
     Returns:
-        Board: The board instance after the simulated move.
+        tuple: Undo record that ``Board.unmake_move`` uses to revert the move.
     """
-    board.move(piece, move[0], move[1])
-    if skipped:
-        board.remove(skipped)
-    return board
+    return board.make_move(move)
 
 
 def get_all_moves(board, color, game):
-    """Return every board state reachable by a single move from ``color``.
+    """Return every legal move for ``color`` without copying the board.
 
     Args:
         board (Board): Current board state to explore from.
@@ -65,14 +584,7 @@ def get_all_moves(board, color, game):
         game (Game): Game instance, currently unused but kept for compatibility.
 
     Returns:
-        list[Board]: All boards generated after every legal move.
+        list[tuple]: Move records ``(origin, destination, captured mask, path)``
+        of every move, shared with the cache of ``Board.legal_moves``.
     """
-    moves = []
-    for piece in board.get_pieces(color):
-        valid_moves = board.get_valid_moves(piece)
-        for move, skipped in valid_moves.items():
-            temp_board = deepcopy(board)
-            temp_piece = temp_board.get_piece(piece.row, piece.col)
-            new_board = simulate_move(temp_piece, move, temp_board, skipped)
-            moves.append(new_board)
-    return moves
+    return board.legal_moves(color)
@@ -0,0 +1,131 @@
+import mmap
+import os
+import struct
+
+from checkers.constants import AZUL_MARINHO, WHITE
+from checkers.zobrist import position_key
+
+# Esse arquivo lê e grava o livro de aberturas: um arquivo binário com registros de tamanho fixo ordenados pela chave
+# de Zobrist da posição. Na hora do jogo o arquivo é mapeado em memória (mmap) e consultado por busca binária, então
+# abrir o livro não lê o arquivo inteiro e cada consulta toca só algumas páginas.
+
+MAGIC = b"DAMASBK1"
+HEADER = struct.Struct("<8sQ")
+# chave, casas capturadas, avaliação, origem, destino, profundidade da busca
+RECORD = struct.Struct("<QIhBBBx")
+SCORE_LIMIT = 2 ** 15 - 1
+
+
+def write_book(path, entries):
+    """Write ``entries`` as a book file, sorted by key.
+
+    The file is written next to ``path`` and renamed at the end, so a
+    running game never sees a half-written book.
+
+    Args:
+        path (str): Output file.
+        entries (Iterable[tuple[int, tuple, float, int]]): Position key, best move record,
+            score and search depth of every book position.
+
+    Returns:
+        int: Number of positions written.
+    """
+    records = sorted(entries, key=lambda entry: entry[0])
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(records)))
+        for key, move, score, depth in records:
+            # Uma avaliação fora da faixa do registro vira o maior valor que cabe nele
+            score = int(max(-SCORE_LIMIT, min(SCORE_LIMIT, score)))
+            file.write(RECORD.pack(key, move[2], score, move[0], move[1], depth))
+    os.replace(temporary, path)
+    return len(records)
+
+
+class OpeningBook:
+    """Read-only, memory-mapped opening book."""
+
+    def __init__(self, path):
+        """Map ``path`` into memory and check its header.
+
+        Args:
+            path (str): Book file written by ``write_book``.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the file is not a book.
+        """
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            raise ValueError(f"Livro de aberturas inválido: {path}")
+        magic, self.count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or len(self.data) != HEADER.size + self.count * RECORD.size:
+            raise ValueError(f"Livro de aberturas inválido: {path}")
+
+    def __len__(self):
+        """Return the number of positions in the book.
+
+        Args:
+            None
+
+        Returns:
+            int: Number of records.
+        """
+        return self.count
+
+    def close(self):
+        """Unmap the file.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.data.close()
+
+    def _find(self, key):
+        """Binary-search the records for ``key``.
+
+        Args:
+            key (int): Position key.
+
+        Returns:
+            tuple | None: Unpacked record, or ``None`` when the position is not in the book.
+        """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            record = RECORD.unpack_from(self.data, HEADER.size + middle * RECORD.size)
+            if record[0] < key:
+                low = middle + 1
+            elif record[0] > key:
+                high = middle
+            else:
+                return record
+        return None
+
+    def probe(self, position, max_player):
+        """Return the book move and score for ``position``, if it is in the book.
+
+        The stored move is matched against the legal moves of the position,
+        so a hash collision can never produce an illegal move.
+
+        Args:
+            position (Board): Current position.
+            max_player (bool): ``True`` if dark blue is to move.
+
+        Returns:
+            tuple[tuple, int, int] | None: Move record, score and search depth, or ``None``.
+        """
+        record = self._find(position_key(position, max_player))
+        if record is None:
+            return None
+        _, captured, score, origin, dest, depth = record
+        for move in position.legal_moves(AZUL_MARINHO if max_player else WHITE):
+            if move[0] == origin and move[1] == dest and move[2] == captured:
+                return move, score, depth
+        return None
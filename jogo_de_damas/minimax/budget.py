@@ -0,0 +1,100 @@
+import time
+
+# Esse arquivo define o orçamento de tempo e de nós que limita a busca com aprofundamento iterativo.
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search tree when the budget runs out or the search is cancelled."""
+
+
+class SearchBudget:
+    """Wall-clock and node limits for a single AI move."""
+    CLOCK_INTERVAL = 256
+
+    def __init__(self, time_limit=None, node_limit=None):
+        """Store the limits; ``None`` disables the corresponding check.
+
+        Args:
+            time_limit (float, optional): Seconds the search may run.
+            node_limit (int, optional): Nodes the search may visit.
+
+        Returns:
+            None
+        """
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.started = None
+        self.armed = True
+        self.cancelled = False
+
+    def start(self):
+        """Start the clock for a new search.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.started = time.perf_counter()
+
+    def elapsed(self):
+        """Return the seconds since ``start`` was called.
+
+        Args:
+            None
+
+        Returns:
+            float: Elapsed wall-clock time.
+        """
+        return time.perf_counter() - self.started
+
+    def set_limits(self, time_limit=None, node_limit=None):
+        """Replace the limits of a search that may already be running; safe to call from another thread.
+
+        The limits still count from ``start``, so a search that has already
+        used up the new time limit stops at its next clock check.
+
+        Args:
+            time_limit (float, optional): Seconds the search may run.
+            node_limit (int, optional): Nodes the search may visit.
+
+        Returns:
+            None
+        """
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+
+    def cancel(self):
+        """Ask the search to stop at the next node; safe to call from another thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.cancelled = True
+
+    def check(self, nodes):
+        """Raise ``SearchTimeout`` if the search was cancelled or has used up its budget.
+
+        Cancellation is always honoured; the limits only apply while
+        ``armed`` is set. The clock is only read every ``CLOCK_INTERVAL``
+        nodes to keep the check cheap.
+
+        Args:
+            nodes (int): Nodes visited so far.
+
+        Returns:
+            None
+        """
+        if self.cancelled:
+            raise SearchTimeout()
+        if not self.armed:
+            return
+        if self.node_limit is not None and nodes >= self.node_limit:
+            raise SearchTimeout()
+        if (self.time_limit is not None and nodes % self.CLOCK_INTERVAL == 0
+                and time.perf_counter() - self.started >= self.time_limit):
+            raise SearchTimeout()
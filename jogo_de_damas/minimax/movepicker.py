@@ -0,0 +1,55 @@
+# Esse arquivo entrega as jogadas de um nó da busca em etapas: primeiro a jogada da tabela de transposição e a da
+# variante principal, testadas direto no bitboard, e só depois, se nenhuma delas provocar um corte, a lista completa
+# gerada e ordenada. Como a captura é obrigatória, essa lista tem só capturas ou só jogadas simples.
+
+
+class MovePicker:
+    """Lazy, staged source of the moves of one search node."""
+
+    def __init__(self, position, color, ordering, ply, hash_move=None):
+        """Remember the node; nothing is generated until iteration starts.
+
+        Args:
+            position (Board): Board of the node.
+            color (tuple): Color to move.
+            ordering (MoveOrdering): Heuristics used to sort the full list.
+            ply (int): Distance from the root of the search.
+            hash_move (tuple, optional): Move stored in the transposition table.
+
+        Returns:
+            None
+        """
+        self.position = position
+        self.color = color
+        self.ordering = ordering
+        self.ply = ply
+        self.hash_move = hash_move
+        self.generated = 0
+
+    def __iter__(self):
+        """Yield the moves in search order, generating the full list only when it is reached.
+
+        The caller may apply each move on ``position`` and must undo it
+        before asking for the next one.
+
+        Args:
+            None
+
+        Returns:
+            Iterator[tuple]: Move records, each one once.
+        """
+        position, color, ordering, ply = self.position, self.color, self.ordering, self.ply
+        tried = []
+        pv = ordering.principal_variation
+        for move in (self.hash_move, pv[ply] if ply < len(pv) else None):
+            # Capturas vêm da geração completa de qualquer jeito, então só as jogadas simples são adiantadas
+            if move is not None and not move[2] and move not in tried and position.is_legal(move, color):
+                tried.append(move)
+                self.generated += 1
+                yield move
+
+        moves = ordering.order(position.legal_moves(color), ply, self.hash_move, position.bits.kings)
+        self.generated = len(moves)
+        for _, move in moves:
+            if move not in tried:
+                yield move
@@ -0,0 +1,81 @@
+from checkers.bitboard import SQUARES
+
+# Esse arquivo guarda as heurísticas de ordenação de movimentos usadas pela poda alfa-beta:
+# capturas, promoções, movimentos killer e a tabela de histórico. As jogadas são tuplas (origem, destino, capturas, caminho),
+# que já servem de chave nas tabelas.
+
+# Casas da primeira e da última linha, onde os homens são promovidos
+PROMOTION_SQUARES = (1 << 4) - 1 | ((1 << 4) - 1) << (SQUARES - 4)
+
+
+class MoveOrdering:
+    """Killer moves and history scores shared across one search."""
+    KILLERS_PER_PLY = 2
+
+    def __init__(self):
+        """Start with empty killer slots and an empty history table.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.killers = {}
+        self.history = {}
+        self.principal_variation = []
+
+    def order(self, moves, ply, hash_move=None, kings=0):
+        """Sort ``moves`` so the most promising ones are searched first.
+
+        The move stored in the transposition table comes first, then the move
+        of the previous principal variation at ``ply``, then captures
+        (longest first), promotions, the killer moves of ``ply`` and finally
+        the quiet moves by history score. Ties keep the generation order.
+
+        Args:
+            moves (list[tuple]): Moves returned by ``get_all_moves``.
+            ply (int): Distance from the root of the search.
+            hash_move (tuple, optional): Move stored in the transposition table.
+            kings (int, optional): Mask of the kings on the board, to tell promotions apart.
+
+        Returns:
+            list[tuple[int, tuple]]: Generation index and move, in search order.
+        """
+        killers = self.killers.get(ply, ())
+        pv_move = self.principal_variation[ply] if ply < len(self.principal_variation) else None
+
+        def priority(entry):
+            move = entry[1]
+            origin, dest, captured, _ = move
+            promotes = not kings >> origin & 1 and PROMOTION_SQUARES >> dest & 1
+            return (
+                move != hash_move,
+                move != pv_move,
+                not captured,
+                -captured.bit_count(),
+                not promotes,
+                move not in killers,
+                -self.history.get(move, 0),
+            )
+
+        return sorted(enumerate(moves), key=priority)
+
+    def cutoff(self, move, ply, depth):
+        """Remember a quiet ``move`` that caused a beta cutoff.
+
+        Args:
+            move (tuple): Move that refuted the node.
+            ply (int): Distance from the root of the search.
+            depth (int): Remaining depth at the node, used to weight the history.
+
+        Returns:
+            None
+        """
+        if move[2]:
+            return
+        self.history[move] = self.history.get(move, 0) + depth * depth
+        killers = self.killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[self.KILLERS_PER_PLY:]
@@ -0,0 +1,126 @@
+import multiprocessing
+
+from checkers.constants import AZUL_MARINHO, WHITE
+from .agent import minimax, window_search, get_all_moves, play_move, terminal_score
+from .transposition import TranspositionTable
+
+# Esse arquivo distribui a busca entre vários processos: cada filho da raiz é avaliado em um processo do pool
+# (divisão na raiz), e cada processo mantém sua própria tabela de transposição entre as tarefas. A primeira jogada é
+# buscada sozinha, e a nota dela serve de janela para as demais, como faria o alfa-beta sequencial na raiz.
+
+_table = None
+
+
+def _init_worker(table_size):
+    """Pool initializer: give the worker process its own transposition table.
+
+    Args:
+        table_size (int): Number of slots of the table.
+
+    Returns:
+        None
+    """
+    global _table
+    _table = TranspositionTable(table_size)
+
+
+def _score_child(task):
+    """Search one root child in a worker process.
+
+    Args:
+        task (tuple[Board, int, float, float, bool]): Child board, remaining depth, window and side to move.
+
+    Returns:
+        float: Score of the child counted from the root; exact when it falls inside the window.
+    """
+    board, depth, alpha, beta, max_player = task
+    return window_search(board, depth, alpha, beta, max_player, 1, _table)
+
+
+class ParallelSearch:
+    """Root-splitting minimax over a ``multiprocessing`` pool."""
+
+    def __init__(self, workers=None, table_size=1 << 16):
+        """Start the worker pool.
+
+        Args:
+            workers (int, optional): Number of processes; defaults to the CPU count.
+            table_size (int, optional): Transposition table slots per worker.
+
+        Returns:
+            None
+        """
+        self.workers = workers or multiprocessing.cpu_count()
+        self.pool = multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=(table_size,))
+
+    def __enter__(self):
+        """Return the search itself so it can be used in a ``with`` block.
+
+        Args:
+            None
+
+        Returns:
+            ParallelSearch: This instance.
+        """
+        return self
+
+    def __exit__(self, *exc):
+        """Shut the pool down when leaving a ``with`` block.
+
+        Args:
+            *exc: Exception information, ignored.
+
+        Returns:
+            None
+        """
+        self.close()
+
+    def close(self):
+        """Terminate the worker processes.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.pool.terminate()
+        self.pool.join()
+
+    def search(self, position, depth, max_player):
+        """Search ``position`` to ``depth`` with every root move scored in parallel.
+
+        The first generated move is searched alone with a full window. The
+        others run in parallel with its score as the bound, so they only
+        return exact scores when they beat it. Ties go to the move generated
+        first, so the chosen move and its score are the ones ``minimax``
+        gives at that depth.
+
+        Args:
+            position (Board): Current board state to explore from; it is left unchanged.
+            depth (int): Search depth, counting the root move.
+            max_player (bool): ``True`` if it is the AI (dark blue) turn.
+
+        Returns:
+            tuple[int, Board]: Evaluation score and the associated board state.
+        """
+        if depth == 0 or terminal_score(position, max_player) is not None:
+            return minimax(position, depth, max_player, None)
+
+        color = AZUL_MARINHO if max_player else WHITE
+        moves = get_all_moves(position, color, None)
+        best_move = moves[0]
+        best_eval = self.pool.apply(_score_child, ((play_move(position, best_move), depth - 1, float("-inf"),
+                                                    float("inf"), not max_player),))
+        if max_player:
+            alpha, beta = best_eval, float("inf")
+        else:
+            alpha, beta = float("-inf"), best_eval
+        children = [(play_move(position, move), depth - 1, alpha, beta, not max_player) for move in moves[1:]]
+        scores = self.pool.map(_score_child, children, chunksize=1)
+
+        for score, move in zip(scores, moves[1:]):
+            if max_player and score > best_eval or not max_player and score < best_eval:
+                best_eval = score
+                best_move = move
+        return best_eval, play_move(position, best_move)
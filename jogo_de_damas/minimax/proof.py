@@ -0,0 +1,245 @@
+from checkers.constants import AZUL_MARINHO, WHITE
+from .budget import SearchBudget, SearchTimeout
+from .stats import SearchStats
+from .tablebase import WIN
+
+# Esse arquivo prova (ou refuta) que o lado a jogar tem uma vitória forçada, com busca por números de prova. Em vez de
+# ir até uma profundidade fixa e avaliar as folhas, a árvore cresce sempre no ponto que está mais perto de decidir o
+# resultado, então linhas que não mudam a resposta quase não são exploradas. Serve para conferir problemas e
+# analisar táticas, onde só interessa se a vitória existe e qual é a linha.
+
+INFINITY = float("inf")
+
+
+class _ProofNode:
+    """Node of the proof tree: the move that reaches it and its proof and disproof numbers."""
+    __slots__ = ("move", "attacker", "proof", "disproof", "children")
+
+    def __init__(self, move, attacker, proof, disproof):
+        """Create an unexpanded node.
+
+        Args:
+            move (tuple | None): Move record that leads here from the parent; ``None`` at the root.
+            attacker (bool): ``True`` if the side trying to win is to move here.
+            proof (float): Minimum number of leaves still needed to prove the win.
+            disproof (float): Minimum number of leaves still needed to refute it.
+
+        Returns:
+            None
+        """
+        self.move = move
+        self.attacker = attacker
+        self.proof = proof
+        self.disproof = disproof
+        self.children = None
+
+
+def proof_number_search(position, max_player, node_limit=None, time_limit=None, stats=None, tablebase=None,
+                        budget=None):
+    """Prove or disprove a forced win for the side to move in ``position``.
+
+    The tree is grown best-first: from the root the search follows, at each
+    node, the child that is cheapest to prove (where the attacker moves) or
+    to refute (where the defender moves), expands that leaf and updates the
+    numbers back to the root. Draws, by repetition or by the forty-ply rule,
+    count as a failure to win. Positions covered by ``tablebase`` are solved
+    on the spot, unless a table win is too long to finish before the
+    forty-ply rule draws the game (see ``Tablebase.probe_position``). Every node of the tree stays in memory, so ``node_limit``
+    is also the memory budget.
+
+    Args:
+        position (Board): Position to solve; it is modified during the search and restored.
+        max_player (bool): ``True`` if dark blue is to move and tries to win.
+        node_limit (int, optional): Largest number of tree nodes.
+        time_limit (float, optional): Seconds the search may run.
+        stats (SearchStats, optional): Receives the node count, the time and the line.
+        tablebase (Tablebase, optional): Endgame tables used as exact leaves.
+        budget (SearchBudget, optional): Budget to use instead of building one from
+            ``time_limit``, so another thread can cancel the search. It is checked once per
+            expansion.
+
+    Returns:
+        tuple[bool | None, list[tuple]]: ``True`` with the winning line, ``False`` with the
+        defence that refutes it, or ``None`` and an empty line when the budget runs out first.
+    """
+    if budget is None:
+        budget = SearchBudget(time_limit)
+    budget.start()
+    stats = stats if stats is not None else SearchStats()
+    attacker = AZUL_MARINHO if max_player else WHITE
+    root = _ProofNode(None, True, *_leaf_numbers(position, attacker, attacker, tablebase))
+    first = stats.nodes
+    stats.nodes += 1
+
+    expansions = 0
+    try:
+        while root.proof and root.disproof:
+            if node_limit is not None and stats.nodes - first >= node_limit:
+                raise SearchTimeout()
+            budget.check(expansions)
+            expansions += 1
+            _grow(root, position, attacker, tablebase, stats)
+    except SearchTimeout:
+        stats.seconds += budget.elapsed()
+        return None, []
+
+    proven = root.proof == 0
+    line = _solution_line(root, position, attacker, proven, tablebase)
+    stats.depth = len(line)
+    stats.principal_variation = line
+    stats.seconds += budget.elapsed()
+    return proven, line
+
+
+def _leaf_numbers(position, color, attacker, tablebase):
+    """Return the initial proof and disproof numbers of a new node.
+
+    Finished games and tablebase positions are solved at once; any other
+    node starts with its number of moves as the cost for the side that has
+    to answer all of them.
+
+    Args:
+        position (Board): Position of the node.
+        color (tuple): Color to move there.
+        attacker (tuple): Color trying to win.
+        tablebase (Tablebase | None): Endgame tables, if any.
+
+    Returns:
+        tuple[float, float]: Proof and disproof numbers.
+    """
+    outcome = position.outcome(color)
+    if outcome is not None:
+        return (0, INFINITY) if outcome == attacker else (INFINITY, 0)
+    if tablebase is not None:
+        entry = tablebase.probe_position(position, color == AZUL_MARINHO)
+        if entry is not None:
+            won = entry[0] == WIN if color == attacker else entry[0] == -WIN
+            return (0, INFINITY) if won else (INFINITY, 0)
+    moves = len(position.legal_moves(color))
+    return (1, moves) if color == attacker else (moves, 1)
+
+
+def _grow(root, position, attacker, tablebase, stats):
+    """Expand the most-proving leaf and update the numbers on its path.
+
+    Args:
+        root (_ProofNode): Root of the tree.
+        position (Board): Root position; it is restored before returning.
+        attacker (tuple): Color trying to win.
+        tablebase (Tablebase | None): Endgame tables, if any.
+        stats (SearchStats): Node counter.
+
+    Returns:
+        None
+    """
+    node = root
+    color = attacker
+    path = []
+    undos = []
+    try:
+        while node.children is not None:
+            if node.attacker:
+                child = min(node.children, key=lambda candidate: candidate.proof)
+            else:
+                child = min(node.children, key=lambda candidate: candidate.disproof)
+            path.append(node)
+            undos.append(position.make_move(child.move))
+            node = child
+            color = WHITE if color == AZUL_MARINHO else AZUL_MARINHO
+
+        reply = WHITE if color == AZUL_MARINHO else AZUL_MARINHO
+        children = []
+        for move in position.legal_moves(color):
+            undo = position.make_move(move)
+            try:
+                children.append(_ProofNode(move, not node.attacker, *_leaf_numbers(position, reply, attacker, tablebase)))
+            finally:
+                position.unmake_move(undo)
+        node.children = children
+        stats.nodes += len(children)
+        _update(node)
+    finally:
+        while undos:
+            position.unmake_move(undos.pop())
+    for node in reversed(path):
+        _update(node)
+
+
+def _update(node):
+    """Recompute the numbers of an expanded node from its children.
+
+    Once a node is solved only the children that decide it are needed, so
+    the others are dropped to save memory.
+
+    Args:
+        node (_ProofNode): Expanded node.
+
+    Returns:
+        None
+    """
+    children = node.children
+    if node.attacker:
+        node.proof = min(child.proof for child in children)
+        node.disproof = sum(child.disproof for child in children)
+        if node.proof == 0:
+            node.children = [child for child in children if child.proof == 0][:1]
+    else:
+        node.proof = sum(child.proof for child in children)
+        node.disproof = min(child.disproof for child in children)
+        if node.disproof == 0:
+            node.children = [child for child in children if child.disproof == 0][:1]
+
+
+def _height(node, proven):
+    """Return the length of the longest line of a solved subtree.
+
+    Args:
+        node (_ProofNode): Solved node.
+        proven (bool): ``True`` if the subtree proves the win, ``False`` if it refutes it.
+
+    Returns:
+        int: Plies from ``node`` to the deepest solved leaf.
+    """
+    if not node.children:
+        return 0
+    return 1 + max(_height(child, proven) for child in node.children)
+
+
+def _solution_line(root, position, attacker, proven, tablebase):
+    """Extract the main line of the solved tree, continued through the tablebase.
+
+    Where the winning side moves it plays the move that decided the node;
+    where the other side moves it picks the reply that resists the longest.
+
+    Args:
+        root (_ProofNode): Solved root.
+        position (Board): Root position; it is left unchanged.
+        attacker (tuple): Color trying to win.
+        proven (bool): ``True`` if the win was proven.
+        tablebase (Tablebase | None): Endgame tables, if any.
+
+    Returns:
+        list[tuple]: Move records from the root.
+    """
+    line = []
+    undos = []
+    node = root
+    color = attacker
+    try:
+        while node.children:
+            node = max(node.children, key=lambda child: _height(child, proven))
+            line.append(node.move)
+            undos.append(position.make_move(node.move))
+            color = WHITE if color == AZUL_MARINHO else AZUL_MARINHO
+        # A árvore para nas posições da tabela de finais; dali em diante a própria tabela dá as jogadas até o fim
+        while tablebase is not None and position.outcome(color) is None:
+            entry = tablebase.best_move(position, color == AZUL_MARINHO)
+            if entry is None or entry[1] != WIN and entry[1] != -WIN:
+                break
+            line.append(entry[0])
+            undos.append(position.make_move(entry[0]))
+            color = WHITE if color == AZUL_MARINHO else AZUL_MARINHO
+    finally:
+        for undo in reversed(undos):
+            position.unmake_move(undo)
+    return line
@@ -0,0 +1,68 @@
+import json
+import time
+
+# Esse arquivo grava as estatísticas de cada busca como uma linha JSON (JSONL), para acompanhar orçamentos de tempo
+# e comparar o comportamento da IA entre versões.
+
+
+class SearchLog:
+    """Append-only JSONL sink for ``SearchStats``."""
+
+    def __init__(self, path):
+        """Open ``path`` for appending; earlier records are kept.
+
+        Args:
+            path (str): Output file.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.file = open(path, "a")
+
+    def __enter__(self):
+        """Return the log itself so it can be used in a ``with`` block.
+
+        Args:
+            None
+
+        Returns:
+            SearchLog: This instance.
+        """
+        return self
+
+    def __exit__(self, *exc):
+        """Close the file when leaving a ``with`` block.
+
+        Args:
+            *exc: Exception information, ignored.
+
+        Returns:
+            None
+        """
+        self.close()
+
+    def write(self, stats, **fields):
+        """Append one record with the counters of ``stats`` and flush it to disk.
+
+        Args:
+            stats (SearchStats): Counters of a finished search.
+            **fields: Extra JSON-serializable values stored with the record, such as the position.
+
+        Returns:
+            None
+        """
+        record = {"time": round(time.time(), 3), **fields, **stats.as_dict()}
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.file.flush()
+
+    def close(self):
+        """Close the underlying file.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.file.close()
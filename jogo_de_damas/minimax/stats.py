@@ -0,0 +1,124 @@
+# Esse arquivo define os contadores coletados durante a busca da IA e o resumo de cada iteração do aprofundamento.
+
+from checkers.notation import move_text
+
+
+class SearchStats:
+    """Counters filled in by a single call to ``minimax`` or ``iterative_deepening``."""
+
+    def __init__(self):
+        """Start every counter at zero.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.nodes = 0
+        self.leaves = 0
+        self.pruned = 0
+        self.cutoffs = 0
+        self.table_hits = 0
+        self.table_stores = 0
+        self.tablebase_hits = 0
+        self.quiescence = 0
+        self.depth = 0
+        self.seconds = 0.0
+        self.score = None
+        self.principal_variation = []
+        self.iterations = []
+
+    def add_iteration(self, depth, nodes, seconds, score, principal_variation):
+        """Record a completed search depth and make it the current result.
+
+        Args:
+            depth (int): Depth that was completed.
+            nodes (int): Nodes visited by this iteration alone.
+            seconds (float): Time spent on this iteration.
+            score (float): Root score found at this depth.
+            principal_variation (list[tuple]): Expected line of play, as move records.
+
+        Returns:
+            None
+        """
+        self.depth = depth
+        self.score = score
+        self.principal_variation = principal_variation
+        self.iterations.append({"depth": depth, "nodes": nodes, "seconds": seconds, "score": score})
+
+    def branching_factor(self):
+        """Return the effective branching factor of the search.
+
+        With two or more iterations this is the growth in nodes from the
+        previous depth to the last one; otherwise it is the ``depth``-th root
+        of the node count.
+
+        Args:
+            None
+
+        Returns:
+            float: Effective branching factor, ``0.0`` before any iteration.
+        """
+        if len(self.iterations) >= 2 and self.iterations[-2]["nodes"]:
+            return self.iterations[-1]["nodes"] / self.iterations[-2]["nodes"]
+        if self.depth and self.nodes:
+            return self.nodes ** (1 / self.depth)
+        return 0.0
+
+    def as_dict(self):
+        """Return the counters as plain JSON-serializable values.
+
+        Infinite scores become the strings ``"inf"`` and ``"-inf"``, and moves
+        are written in PDN style.
+
+        Args:
+            None
+
+        Returns:
+            dict: Every counter, the branching factor, the principal variation and the iterations.
+        """
+        return {
+            "nodes": self.nodes,
+            "leaves": self.leaves,
+            "pruned": self.pruned,
+            "cutoffs": self.cutoffs,
+            "table_hits": self.table_hits,
+            "table_stores": self.table_stores,
+            "tablebase_hits": self.tablebase_hits,
+            "quiescence": self.quiescence,
+            "depth": self.depth,
+            "seconds": round(self.seconds, 6),
+            "branching_factor": round(self.branching_factor(), 3),
+            "score": _json_score(self.score),
+            "principal_variation": [move_text(move) for move in self.principal_variation],
+            "iterations": [dict(iteration, seconds=round(iteration["seconds"], 6), score=_json_score(iteration["score"]))
+                           for iteration in self.iterations],
+        }
+
+    def __repr__(self):
+        """Return a short summary of the counters.
+
+        Args:
+            None
+
+        Returns:
+            str: Node, cutoff and table counters, the depth reached and the time spent.
+        """
+        return (f"SearchStats(nodes={self.nodes}, leaves={self.leaves}, pruned={self.pruned}, cutoffs={self.cutoffs}, "
+                f"table_hits={self.table_hits}, table_stores={self.table_stores}, tablebase_hits={self.tablebase_hits}, "
+                f"quiescence={self.quiescence}, depth={self.depth}, seconds={self.seconds:.3f})")
+
+
+def _json_score(score):
+    """Return ``score`` in a form that strict JSON parsers accept.
+
+    Args:
+        score (float | None): Search score.
+
+    Returns:
+        float | str | None: The score, or ``"inf"``/``"-inf"`` for infinite values.
+    """
+    if score is None or abs(score) != float("inf"):
+        return score
+    return "inf" if score > 0 else "-inf"
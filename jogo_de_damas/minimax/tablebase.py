@@ -0,0 +1,427 @@
+import mmap
+import os
+import struct
+from itertools import combinations
+from math import comb
+
+from checkers.bitboard import BitBoard, SQUARES
+from checkers.board import DRAW_KING_PLIES
+from checkers.constants import AZUL_MARINHO, WHITE
+from checkers.movegen import generate_moves
+
+# Esse arquivo gera e lê as tabelas de finais: para cada combinação de material com até N peças, todas as posições são
+# resolvidas por análise retrógrada (das posições finais para trás) e gravadas com vitória, derrota ou empate e a
+# distância até o fim em lances. Cada posição tem um índice calculado direto das casas ocupadas, então a consulta
+# durante a busca é um acesso a um byte do arquivo mapeado em memória, sem leitura de arquivo.
+
+MAGIC = b"DAMASTB1"
+HEADER = struct.Struct("<8sBH")
+# homens brancos, damas brancas, homens azuis, damas azuis, posição dos dados no arquivo
+ENTRY = struct.Struct("<BBBBQ")
+
+WIN, DRAW, LOSS = 1, 0, -1
+# Um byte por posição: 0 é empate, 1..127 vitória e 128..255 derrota em (valor - 128) lances
+LOSS_BASE = 128
+MAX_DISTANCE = 127
+# Casas em que um homem nunca fica parado, porque ali ele vira dama
+WHITE_PROMOTION = 0xF
+DARKBLUE_PROMOTION = 0xF << (SQUARES - 4)
+BINOMIAL = [[comb(n, k) for k in range(SQUARES + 1)] for n in range(SQUARES + 1)]
+
+
+def signatures(pieces):
+    """List every material balance with up to ``pieces`` pieces, in the order they must be solved.
+
+    A capture always leads to fewer pieces and a promotion to fewer men, so
+    each balance only depends on the ones listed before it.
+
+    Args:
+        pieces (int): Largest number of pieces on the board.
+
+    Returns:
+        list[tuple[int, int, int, int]]: White men, white kings, dark blue men and dark blue kings.
+    """
+    found = []
+    for white in range(1, pieces):
+        for darkblue in range(1, pieces - white + 1):
+            for white_men in range(white + 1):
+                for darkblue_men in range(darkblue + 1):
+                    found.append((white_men, white - white_men, darkblue_men, darkblue - darkblue_men))
+    return sorted(found, key=lambda signature: (sum(signature), signature[0] + signature[2], signature))
+
+
+def table_size(signature):
+    """Return the number of entries of the table of ``signature``.
+
+    Args:
+        signature (tuple[int, int, int, int]): Material balance.
+
+    Returns:
+        int: Entries, one per placement of every group and side to move.
+    """
+    size = 2
+    for count in signature:
+        size *= BINOMIAL[SQUARES][count]
+    return size
+
+
+def _groups(white, darkblue, kings):
+    """Split the position into the four piece groups of a signature.
+
+    Args:
+        white (int): White mask.
+        darkblue (int): Dark blue mask.
+        kings (int): King mask.
+
+    Returns:
+        tuple[int, int, int, int]: Masks of white men, white kings, dark blue men and dark blue kings.
+    """
+    return white & ~kings, white & kings, darkblue & ~kings, darkblue & kings
+
+
+def _index(groups, max_player):
+    """Return the entry of a position inside the table of its signature.
+
+    Every group is ranked as a combination of squares (combinatorial number
+    system), so the index costs a handful of additions per piece.
+
+    Args:
+        groups (tuple[int, int, int, int]): Masks returned by ``_groups``.
+        max_player (bool): ``True`` if dark blue is to move.
+
+    Returns:
+        int: Entry index.
+    """
+    index = 0
+    for mask in groups:
+        rank = 0
+        count = 0
+        while mask:
+            low = mask & -mask
+            count += 1
+            rank += BINOMIAL[low.bit_length() - 1][count]
+            mask ^= low
+        index = index * BINOMIAL[SQUARES][count] + rank
+    return index * 2 + max_player
+
+
+def _decode(value):
+    """Turn a stored byte into a result and a distance.
+
+    Args:
+        value (int): Stored byte.
+
+    Returns:
+        tuple[int, int]: ``WIN``, ``DRAW`` or ``LOSS`` for the side to move and the distance in plies.
+    """
+    if value == 0:
+        return DRAW, 0
+    if value < LOSS_BASE:
+        return WIN, value
+    return LOSS, value - LOSS_BASE
+
+
+def _play(white, darkblue, kings, move, max_player):
+    """Apply ``move`` to bare masks.
+
+    Args:
+        white (int): White mask.
+        darkblue (int): Dark blue mask.
+        kings (int): King mask.
+        move (tuple): Move record from ``generate_moves``.
+        max_player (bool): ``True`` if dark blue moves.
+
+    Returns:
+        tuple[int, int, int]: White, dark blue and king masks after the move.
+    """
+    origin, dest, captured, _ = move
+    if origin != dest:
+        both = 1 << origin | 1 << dest
+        if max_player:
+            darkblue ^= both
+        else:
+            white ^= both
+        if kings >> origin & 1:
+            kings ^= both
+        elif 1 << dest & (DARKBLUE_PROMOTION if max_player else WHITE_PROMOTION):
+            kings |= 1 << dest
+    if max_player:
+        white &= ~captured
+    else:
+        darkblue &= ~captured
+    return white, darkblue, kings & ~captured
+
+
+def _placements(signature):
+    """Yield every legal placement of the pieces of ``signature``.
+
+    Args:
+        signature (tuple[int, int, int, int]): Material balance.
+
+    Returns:
+        Iterator[tuple[int, int, int]]: White, dark blue and king masks.
+    """
+    white_men, white_kings, darkblue_men, darkblue_kings = signature
+    everywhere = range(SQUARES)
+    groups = (
+        (white_men, [sq for sq in everywhere if not WHITE_PROMOTION >> sq & 1]),
+        (white_kings, everywhere),
+        (darkblue_men, [sq for sq in everywhere if not DARKBLUE_PROMOTION >> sq & 1]),
+        (darkblue_kings, everywhere),
+    )
+    masks = []
+    for count, squares in groups:
+        masks.append([sum(1 << sq for sq in chosen) for chosen in combinations(squares, count)])
+
+    for men in masks[0]:
+        for white_king in masks[1]:
+            if men & white_king:
+                continue
+            white = men | white_king
+            for darkblue_man in masks[2]:
+                if white & darkblue_man:
+                    continue
+                for darkblue_king in masks[3]:
+                    if (white | darkblue_man) & darkblue_king:
+                        continue
+                    yield white, darkblue_man | darkblue_king, white_king | darkblue_king
+
+
+def solve(signature, solved):
+    """Solve every position of ``signature`` by retrograde analysis.
+
+    Each position is generated once to link it to its successors; the
+    positions of other balances (after a capture or a promotion) are read
+    from ``solved``. Results then spread backwards from the positions
+    already decided, one distance at a time: a position that has a move to
+    a lost position is won one ply later, and a position whose moves all
+    lead to won positions is lost at the longest of those distances. What
+    is never decided is a draw. The tables ignore the forty-ply rule and
+    repetitions, as usual for endgame databases; ``Tablebase.probe_position``
+    only trusts the wins that the rule cannot turn into draws.
+
+    Args:
+        signature (tuple[int, int, int, int]): Material balance to solve.
+        solved (dict[tuple, bytes]): Tables of every balance it depends on.
+
+    Returns:
+        bytearray: One byte per entry, as described in ``_decode``.
+
+    Raises:
+        ValueError: If a distance does not fit in a byte.
+    """
+    values = bytearray(table_size(signature))
+    remaining = {}
+    longest = {}
+    parents = {}
+    buckets = [[] for _ in range(2 * MAX_DISTANCE + 2)]
+
+    for white, darkblue, kings in _placements(signature):
+        groups = _groups(white, darkblue, kings)
+        for max_player in (False, True):
+            node = _index(groups, max_player)
+            moves = generate_moves(BitBoard(darkblue, white, kings), AZUL_MARINHO if max_player else WHITE)
+            open_moves = 0
+            worst = 0
+            for move in moves:
+                after = _play(white, darkblue, kings, move, max_player)
+                if not (after[0] if max_player else after[1]):
+                    # Capturou a última peça do adversário
+                    buckets[1].append((node, WIN))
+                    open_moves += 1
+                    continue
+                child_groups = _groups(*after)
+                child = _index(child_groups, not max_player)
+                child_signature = tuple(mask.bit_count() for mask in child_groups)
+                if child_signature == signature:
+                    parents.setdefault(child, []).append(node)
+                    open_moves += 1
+                    continue
+                result, distance = _decode(solved[child_signature][child])
+                if result == LOSS:
+                    buckets[distance + 1].append((node, WIN))
+                if result == WIN:
+                    worst = max(worst, distance + 1)
+                else:
+                    open_moves += 1
+            remaining[node] = open_moves
+            longest[node] = worst
+            if not open_moves:
+                buckets[worst].append((node, LOSS))
+
+    for distance, bucket in enumerate(buckets):
+        for node, result in bucket:
+            if values[node]:
+                continue
+            if distance > MAX_DISTANCE:
+                raise ValueError(f"Distância {distance} não cabe na tabela {signature}")
+            values[node] = distance if result == WIN else LOSS_BASE + distance
+            for parent in parents.get(node, ()):
+                if values[parent]:
+                    continue
+                if result == LOSS:
+                    buckets[distance + 1].append((parent, WIN))
+                else:
+                    remaining[parent] -= 1
+                    longest[parent] = max(longest[parent], distance + 1)
+                    if not remaining[parent]:
+                        buckets[longest[parent]].append((parent, LOSS))
+    return values
+
+
+def write_tablebase(path, tables, pieces):
+    """Write solved tables to ``path``.
+
+    The file is written next to ``path`` and renamed at the end, so a
+    running game never sees a half-written file.
+
+    Args:
+        path (str): Output file.
+        tables (dict[tuple, bytes]): Table of every signature.
+        pieces (int): Largest number of pieces covered.
+
+    Returns:
+        int: Number of entries written.
+    """
+    offset = HEADER.size + len(tables) * ENTRY.size
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(MAGIC, pieces, len(tables)))
+        for signature, values in tables.items():
+            file.write(ENTRY.pack(*signature, offset))
+            offset += len(values)
+        for values in tables.values():
+            file.write(values)
+    os.replace(temporary, path)
+    return sum(len(values) for values in tables.values())
+
+
+class Tablebase:
+    """Read-only, memory-mapped endgame tables."""
+
+    def __init__(self, path):
+        """Map ``path`` into memory and read its directory of tables.
+
+        Args:
+            path (str): File written by ``write_tablebase``.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the file is not a tablebase.
+        """
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            raise ValueError(f"Tabela de finais inválida: {path}")
+        magic, self.pieces, count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Tabela de finais inválida: {path}")
+        self.tables = {}
+        end = HEADER.size + count * ENTRY.size
+        for number in range(count):
+            *signature, offset = ENTRY.unpack_from(self.data, HEADER.size + number * ENTRY.size)
+            signature = tuple(signature)
+            self.tables[signature] = offset
+            end = max(end, offset + table_size(signature))
+        if len(self.data) != end:
+            raise ValueError(f"Tabela de finais inválida: {path}")
+
+    def __len__(self):
+        """Return the number of entries in the file.
+
+        Args:
+            None
+
+        Returns:
+            int: Entries of every table.
+        """
+        return sum(table_size(signature) for signature in self.tables)
+
+    def close(self):
+        """Unmap the file.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.data.close()
+
+    def probe(self, bits, max_player):
+        """Return the exact result of a position, if its material is covered.
+
+        Args:
+            bits (BitBoard): Position to look up.
+            max_player (bool): ``True`` if dark blue is to move.
+
+        Returns:
+            tuple[int, int] | None: ``WIN``, ``DRAW`` or ``LOSS`` for the side to move and the
+            distance to the end in plies, or ``None`` when the position is not in the tables.
+        """
+        if (bits.white | bits.darkblue).bit_count() > self.pieces:
+            return None
+        groups = _groups(bits.white, bits.darkblue, bits.kings)
+        offset = self.tables.get(tuple(mask.bit_count() for mask in groups))
+        if offset is None:
+            return None
+        return _decode(self.data[offset + _index(groups, max_player)])
+
+    def probe_position(self, position, max_player):
+        """Return the result of a game position, when the rules of the game agree with the tables.
+
+        The tables are solved without the forty-ply rule, so a win may take
+        more consecutive king moves than the game allows before it is drawn.
+        A win or a loss is only returned when it ends within the king plies
+        still left, ``distance + position.reversible < DRAW_KING_PLIES``;
+        captures and man moves only reset the count, so such a result holds
+        whatever the line. The distance falls with every move of a table
+        line, so the line never repeats a position either. Draws always hold.
+
+        Args:
+            position (Board): Position to look up, with its count of reversible plies.
+            max_player (bool): ``True`` if dark blue is to move.
+
+        Returns:
+            tuple[int, int] | None: Result and distance as in ``probe``, or ``None`` when the
+            position is not in the tables or its result may end in a draw.
+        """
+        entry = self.probe(position.bits, max_player)
+        if entry is None or entry[0] != DRAW and entry[1] + position.reversible >= DRAW_KING_PLIES:
+            return None
+        return entry
+
+    def best_move(self, position, max_player):
+        """Pick the move that wins fastest, holds the draw or loses slowest.
+
+        Args:
+            position (Board): Current position; it is left unchanged.
+            max_player (bool): ``True`` if dark blue is to move.
+
+        Returns:
+            tuple[tuple, int, int] | None: Move record, result and distance for the side to
+            move, or ``None`` when ``probe_position`` has no result for the position.
+        """
+        if self.probe_position(position, max_player) is None:
+            return None
+        best = None
+        for move in position.legal_moves(AZUL_MARINHO if max_player else WHITE):
+            undo = position.make_move(move)
+            try:
+                bits = position.bits
+                if not (bits.white if max_player else bits.darkblue):
+                    result, distance = WIN, 1
+                else:
+                    result, distance = self.probe(bits, not max_player)
+                    result, distance = -result, distance + 1
+            finally:
+                position.unmake_move(undo)
+            # Vitória mais curta, depois empate, depois derrota mais longa
+            rank = (result, -distance if result == WIN else distance)
+            if best is None or rank > best[0]:
+                best = rank, move, result, distance
+        if best is None:
+            return None
+        return best[1], best[2], best[3]
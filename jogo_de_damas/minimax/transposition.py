@@ -0,0 +1,103 @@
+from collections import namedtuple
+
+# Esse arquivo implementa a tabela de transposição: um vetor de tamanho fixo indexado pela chave de Zobrist,
+# de modo que o consumo de memória não cresce com a duração da partida.
+
+EXACT, LOWER, UPPER = range(3)
+
+REPLACE_ALWAYS = "always"
+REPLACE_DEPTH = "depth"
+
+TableEntry = namedtuple("TableEntry", "key depth flag score move generation")
+
+
+class TranspositionTable:
+    """Fixed-size hash table of search results keyed by Zobrist hash."""
+
+    def __init__(self, size=1 << 16, policy=REPLACE_DEPTH):
+        """Allocate every slot up front so memory use never grows.
+
+        Args:
+            size (int, optional): Number of slots, rounded down to a power of two.
+            policy (str, optional): ``REPLACE_ALWAYS`` overwrites any colliding
+                entry; ``REPLACE_DEPTH`` keeps a deeper entry from the current
+                search and only evicts shallower or stale ones.
+
+        Returns:
+            None
+        """
+        if policy not in (REPLACE_ALWAYS, REPLACE_DEPTH):
+            raise ValueError(f"Política de substituição desconhecida: {policy}")
+        size = 1 << (max(size, 1).bit_length() - 1)
+        self.mask = size - 1
+        self.policy = policy
+        self.slots = [None] * size
+        self.generation = 0
+
+    def __len__(self):
+        """Return the number of slots in the table.
+
+        Args:
+            None
+
+        Returns:
+            int: Table capacity.
+        """
+        return len(self.slots)
+
+    def new_search(self):
+        """Age every stored entry so the next search may evict them first.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.generation += 1
+
+    def clear(self):
+        """Drop every stored entry.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.slots = [None] * len(self.slots)
+
+    def probe(self, key):
+        """Return the entry stored for ``key``, if any.
+
+        Args:
+            key (int): Zobrist key of the position.
+
+        Returns:
+            TableEntry | None: Stored entry or ``None`` when missing or overwritten.
+        """
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry.key == key:
+            return entry
+        return None
+
+    def store(self, key, depth, flag, score, move):
+        """Save a search result according to the replacement policy.
+
+        Args:
+            key (int): Zobrist key of the position.
+            depth (int): Remaining depth the score was searched to.
+            flag (int): ``EXACT``, ``LOWER`` or ``UPPER`` bound type.
+            score (float): Score found for the position.
+            move (tuple | None): Best move record, as produced by ``Board.legal_moves``.
+
+        Returns:
+            bool: ``True`` if the entry was written.
+        """
+        index = key & self.mask
+        old = self.slots[index]
+        if (self.policy == REPLACE_DEPTH and old is not None and old.key != key
+                and old.generation == self.generation and old.depth > depth):
+            return False
+        self.slots[index] = TableEntry(key, depth, flag, score, move, self.generation)
+        return True
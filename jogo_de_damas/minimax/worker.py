@@ -0,0 +1,217 @@
+import threading
+from copy import deepcopy
+
+from checkers.constants import AZUL_MARINHO, WHITE
+from checkers.notation import position_text
+from .agent import iterative_deepening, play_move
+from .budget import SearchBudget
+from .stats import SearchStats
+
+# Esse arquivo roda a busca da IA em uma thread separada, para que o loop do Pygame continue desenhando a tela
+# e tratando eventos enquanto a IA pensa. Na vez do adversário, a mesma thread pode "ponderar": buscar a posição
+# depois da resposta esperada, aproveitando a busca se o adversário jogar o lance previsto.
+
+
+class SearchWorker:
+    """Runs ``iterative_deepening`` on a background thread with start/ponder/poll/cancel controls."""
+
+    def __init__(self, time_limit=None, node_limit=None, table=None, log=None, book=None, tablebase=None):
+        """Store the per-move budget and the table shared by every search.
+
+        Args:
+            time_limit (float, optional): Seconds available for each move.
+            node_limit (int, optional): Nodes available for each move.
+            table (TranspositionTable, optional): Table kept between moves.
+            log (SearchLog, optional): Receives the statistics of every finished search.
+            book (OpeningBook, optional): Positions answered without searching.
+            tablebase (Tablebase, optional): Endgame tables used by every search.
+
+        Returns:
+            None
+        """
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.table = table
+        self.log = log
+        self.book = book
+        self.tablebase = tablebase
+        self.stats = None
+        self._thread = None
+        self._budget = None
+        self._result = None
+        self._pondering = None
+        self._searched = None
+
+    @property
+    def running(self):
+        """Return ``True`` while a search thread is alive.
+
+        Args:
+            None
+
+        Returns:
+            bool: Whether a search is in progress.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pondering(self):
+        """Return ``True`` while the worker searches a predicted position on the opponent's time.
+
+        Args:
+            None
+
+        Returns:
+            bool: Whether the current search is a ponder search.
+        """
+        return self._pondering is not None
+
+    def start(self, board, max_player):
+        """Start searching a private copy of ``board``, cancelling any search in progress.
+
+        If a ponder search is running on this very position (the opponent
+        played the predicted move), it is kept and simply given the per-move
+        budget, counted from when pondering began. If a search of this very
+        position has already finished but was not polled yet, its result is
+        kept. A position found in the opening book is answered at once,
+        without a thread.
+
+        Args:
+            board (Board): Position to search; it is copied so the UI can keep drawing it.
+            max_player (bool): ``True`` if the AI plays dark blue.
+
+        Returns:
+            None
+        """
+        signature = _signature(board, max_player)
+        if self._pondering is not None and self._pondering == signature:
+            self._pondering = None
+            self._budget.set_limits(self.time_limit, self.node_limit)
+            return
+        # A busca pode ter terminado entre o poll() e esta chamada: o resultado ainda vale para a mesma posição
+        if self._pondering is None and self._result is not None and self._searched == signature and not self.running:
+            return
+        self.cancel()
+        entry = self.book.probe(board, max_player) if self.book is not None else None
+        if entry is not None:
+            move, score, depth = entry
+            stats = SearchStats()
+            stats.add_iteration(depth, 0, 0.0, score, [move])
+            position = position_text(board, AZUL_MARINHO if max_player else WHITE)
+            self._result = (score, play_move(board, move)), stats, {"position": position, "book": True}
+            return
+        self._launch(deepcopy(board), max_player, SearchBudget(self.time_limit, self.node_limit))
+
+    def ponder(self, board, max_player):
+        """Search the position after the expected reply to the AI move, without limits, until ``start`` is called.
+
+        The expected reply is the second move of the principal variation of
+        the last search. Nothing is started when that line is too short or
+        the move is not legal on ``board``.
+
+        Args:
+            board (Board): Position right after the AI move, with the opponent to move.
+            max_player (bool): ``True`` if the AI plays dark blue.
+
+        Returns:
+            bool: ``True`` if a ponder search was started.
+        """
+        self.cancel()
+        line = self.stats.principal_variation if self.stats is not None else []
+        opponent = WHITE if max_player else AZUL_MARINHO
+        if len(line) < 2 or line[1] not in board.legal_moves(opponent):
+            return False
+        position = deepcopy(board)
+        position.make_move(line[1])
+        self._pondering = _signature(position, max_player)
+        # Sem limites: a busca só para quando o adversário joga (start) ou o lance previsto não vem (cancel)
+        self._launch(position, max_player, SearchBudget())
+        return True
+
+    def _launch(self, position, max_player, budget):
+        """Start the search thread on ``position``.
+
+        Args:
+            position (Board): Private board the thread may modify.
+            max_player (bool): ``True`` if the AI plays dark blue.
+            budget (SearchBudget): Budget of the search, also used to cancel it.
+
+        Returns:
+            None
+        """
+        self._budget = budget
+        self._searched = _signature(position, max_player)
+        self._thread = threading.Thread(target=self._run, args=(position, max_player, budget), daemon=True)
+        self._thread.start()
+
+    def _run(self, position, max_player, budget):
+        """Thread body: search ``position`` and publish the result unless cancelled.
+
+        Args:
+            position (Board): Private copy of the board to search.
+            max_player (bool): ``True`` if the AI plays dark blue.
+            budget (SearchBudget): Budget of this search, also used to cancel it.
+
+        Returns:
+            None
+        """
+        stats = SearchStats()
+        result = iterative_deepening(position, max_player, None, table=self.table, budget=budget, stats=stats,
+                                     tablebase=self.tablebase)
+        if not budget.cancelled:
+            self._result = result, stats, {"position": position_text(position, AZUL_MARINHO if max_player else WHITE)}
+
+    def poll(self):
+        """Return the finished search result once, or ``None`` while it is not ready.
+
+        The statistics of that search stay available in ``stats`` until the
+        next one is returned. A ponder search is only returned once ``start``
+        confirms the opponent played the predicted move.
+
+        Args:
+            None
+
+        Returns:
+            tuple[int, Board] | None: Evaluation score and the board after the AI move.
+        """
+        if self.running or self.pondering or self._result is None:
+            return None
+        (result, self.stats, fields), self._result = self._result, None
+        if self.log is not None:
+            self.log.write(self.stats, **fields)
+        return result
+
+    def cancel(self):
+        """Stop the running search, if any, and drop its result.
+
+        The search notices the cancellation at its next node, so this returns
+        almost immediately.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self._budget is not None:
+            self._budget.cancel()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        self._budget = None
+        self._result = None
+        self._pondering = None
+        self._searched = None
+
+
+def _signature(board, max_player):
+    """Return what identifies a search position for a ponder hit.
+
+    Args:
+        board (Board): Position to describe.
+        max_player (bool): ``True`` if dark blue is to move.
+
+    Returns:
+        tuple: Piece bitboards and the side to move.
+    """
+    return board.bits.white, board.bits.darkblue, board.bits.kings, max_player
@@ -0,0 +1,49 @@
+# Esse arquivo verifica se o lado a jogar tem vitória forçada numa posição, com a busca por números de prova de
+# minimax/proof.py, e imprime a linha que prova (ou refuta) a vitória. Execute a partir da raiz do repositório:
+#   python jogo_de_damas/prove.py "B:WK8,K9,K32:BK2,3,16,K21,K23,K24" --nodes 1000000
+
+import argparse
+import os
+
+from checkers.constants import AZUL_MARINHO
+from checkers.notation import parse_position, move_text
+from minimax.proof import proof_number_search
+from minimax.stats import SearchStats
+from minimax.tablebase import Tablebase
+
+NODES = 1000000
+TABLEBASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "finais.bin")
+
+
+def main():
+    """Solve the position given on the command line and print the result.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Prova ou refuta uma vitória forçada.")
+    parser.add_argument("position", help='posição no formato "W:W21,22:BK5,9" (lado a jogar primeiro)')
+    parser.add_argument("--nodes", type=int, default=NODES, help="nós da árvore de prova (limite de memória)")
+    parser.add_argument("--time", type=float, default=None, help="limite de tempo em segundos")
+    parser.add_argument("--tablebase", default=TABLEBASE, help="tabela de finais; vazio para não usar")
+    args = parser.parse_args()
+
+    board, color = parse_position(args.position)
+    tablebase = Tablebase(args.tablebase) if args.tablebase and os.path.exists(args.tablebase) else None
+    stats = SearchStats()
+    proven, line = proof_number_search(board, color == AZUL_MARINHO, args.nodes, args.time, stats, tablebase)
+    if tablebase is not None:
+        tablebase.close()
+
+    if proven is None:
+        print(f"Sem resposta dentro do limite ({stats.nodes} nós, {stats.seconds:.1f}s)")
+        return
+    print(f"{'Vitória forçada' if proven else 'Sem vitória forçada'} ({stats.nodes} nós, {stats.seconds:.1f}s)")
+    print(" ".join(move_text(move) for move in line))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# Esse arquivo joga partidas da IA contra ela mesma, sem janela, distribuídas em um pool de processos. Cada partida
+# terminada é gravada imediatamente como uma linha de um arquivo JSONL, e uma execução interrompida pode ser retomada
+# rodando o mesmo comando de novo. Execute a partir da raiz do repositório:
+#   python jogo_de_damas/selfplay.py --games 1000 --workers 8 --node-limit 20000 --output partidas.jsonl
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+
+from checkers.board import Board, DRAW_KING_PLIES
+from checkers.constants import AZUL_MARINHO, WHITE, DRAW
+from checkers.notation import move_text
+from minimax.agent import iterative_deepening, get_all_moves, simulate_move
+from minimax.stats import SearchStats
+from minimax.transposition import TranspositionTable
+
+SEED = 2024
+MAX_PLIES = 200
+RANDOM_PLIES = 4
+TABLE_SIZE = 1 << 16
+
+_settings = None
+
+
+def _init_worker(settings):
+    """Pool initializer: keep the engine settings for every game of this worker.
+
+    Args:
+        settings (dict): Search limits shared by every game.
+
+    Returns:
+        None
+    """
+    global _settings
+    _settings = settings
+
+
+def _reason(board, outcome):
+    """Describe why the game ended with ``outcome``.
+
+    Args:
+        board (Board): Final position.
+        outcome (tuple | str): Value returned by ``Board.outcome``.
+
+    Returns:
+        str: Short reason stored in the game record.
+    """
+    if outcome == DRAW:
+        return "lances de dama sem captura" if board.reversible >= DRAW_KING_PLIES else "repetição"
+    return "sem peças" if board.winner() is not None else "sem jogadas"
+
+
+def play_game(index):
+    """Play one engine-vs-engine game in a worker process.
+
+    The first plies are chosen at random (seeded by ``index``) so every game
+    follows a different line; after that both sides use iterative deepening.
+
+    Args:
+        index (int): Game number, also used to derive the random seed.
+
+    Returns:
+        dict: Game record with moves, per-move time, nodes and depth, and the result.
+    """
+    settings = _settings
+    rng = random.Random(settings["seed"] + index)
+    board = Board()
+    color = WHITE
+    tables = {WHITE: TranspositionTable(settings["table_size"]), AZUL_MARINHO: TranspositionTable(settings["table_size"])}
+    record = {"game": index, "moves": [], "times": [], "nodes": [], "depths": []}
+    result, reason = None, "limite de jogadas"
+
+    for ply in range(settings["max_plies"]):
+        result = board.outcome(color)
+        if result is not None:
+            reason = _reason(board, result)
+            break
+        moves = get_all_moves(board, color, None)
+
+        stats = SearchStats()
+        started = time.perf_counter()
+        if ply < settings["random_plies"]:
+            move = rng.choice(moves)
+        else:
+            iterative_deepening(board, color == AZUL_MARINHO, None, time_limit=settings["time_limit"],
+                                node_limit=settings["node_limit"], max_depth=settings["max_depth"], stats=stats,
+                                table=tables[color])
+            # A variante principal da última iteração completa começa pela jogada escolhida
+            move = stats.principal_variation[0]
+        elapsed = time.perf_counter() - started
+
+        record["moves"].append(move_text(move))
+        record["times"].append(round(elapsed, 4))
+        record["nodes"].append(stats.nodes)
+        record["depths"].append(stats.depth)
+        simulate_move(move, board)
+        color = AZUL_MARINHO if color == WHITE else WHITE
+    else:
+        result = board.outcome(color)
+        reason = _reason(board, result) if result is not None else reason
+
+    record["result"] = {WHITE: "brancas", AZUL_MARINHO: "azul_marinho", DRAW: "empate", None: "empate"}[result]
+    record["reason"] = reason
+    return record
+
+
+def completed_games(path):
+    """Return the numbers of the games already stored in ``path``.
+
+    A line cut short by an interruption is removed from the end of the file
+    so the next record starts on a clean line.
+
+    Args:
+        path (str): JSONL file with one game per line.
+
+    Returns:
+        set[int]: Game numbers present in the file.
+    """
+    done = set()
+    if not os.path.exists(path):
+        return done
+    valid = 0
+    with open(path, "rb") as file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                done.add(json.loads(line)["game"])
+            except (ValueError, KeyError):
+                break
+            valid += len(line)
+    if valid != os.path.getsize(path):
+        with open(path, "r+b") as file:
+            file.truncate(valid)
+    return done
+
+
+def main():
+    """Run the pending games on a process pool, appending each record to the output as soon as it finishes.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Partidas da IA contra ela mesma, sem janela.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--output", default="partidas.jsonl")
+    parser.add_argument("--time-limit", type=float, default=None, help="segundos por jogada")
+    parser.add_argument("--node-limit", type=int, default=20000, help="nós por jogada")
+    parser.add_argument("--max-depth", type=int, default=8)
+    parser.add_argument("--max-plies", type=int, default=MAX_PLIES)
+    parser.add_argument("--random-plies", type=int, default=RANDOM_PLIES)
+    parser.add_argument("--seed", type=int, default=SEED)
+    args = parser.parse_args()
+
+    done = completed_games(args.output)
+    pending = [index for index in range(args.games) if index not in done]
+    print(f"{len(done)} partidas já gravadas, {len(pending)} a jogar")
+
+    settings = {
+        "seed": args.seed,
+        "time_limit": args.time_limit,
+        "node_limit": args.node_limit,
+        "max_depth": args.max_depth,
+        "max_plies": args.max_plies,
+        "random_plies": args.random_plies,
+        "table_size": TABLE_SIZE,
+    }
+    results = {"brancas": 0, "azul_marinho": 0, "empate": 0}
+    with multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=(settings,)) as pool, \
+            open(args.output, "a") as output:
+        for record in pool.imap_unordered(play_game, pending, chunksize=1):
+            output.write(json.dumps(record, separators=(",", ":")) + "\n")
+            output.flush()
+            results[record["result"]] += 1
+            finished = sum(results.values())
+            print(f"[{finished}/{len(pending)}] partida {record['game']}: {record['result']} "
+                  f"({len(record['moves'])} lances, {record['reason']})")
+
+    print(f"brancas {results['brancas']}  azul marinho {results['azul_marinho']}  empates {results['empate']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Esse arquivo deixa os testes importar os pacotes do jogo como os scripts fazem, a partir da pasta jogo_de_damas.
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,23 @@
+import pytest
+
+from checkers.constants import AZUL_MARINHO
+from checkers.notation import parse_position
+from minimax.agent import minimax, terminal_score, FORCED_WIN, WIN_SCORE
+
+# Esse arquivo testa a pontuação de fim de jogo da busca.
+
+
+def test_no_pieces_and_no_moves_lose_alike():
+    """A side without pieces and a blocked side get the same game-ending score."""
+    no_pieces, _ = parse_position("W:B5")
+    blocked, _ = parse_position("W:W29:B25,22")
+    assert terminal_score(no_pieces, False) == terminal_score(blocked, False) == WIN_SCORE
+    assert terminal_score(blocked, False, ply=3) == WIN_SCORE - 3
+
+
+@pytest.mark.parametrize("text", ["B:W18,20:B8,K25,28", "B:W12,16:B5,K20,26", "B:W10,25:B2,K15,28"])
+def test_capturing_everything_keeps_the_forced_win(text):
+    """Finishing the game by capture is worth as much as a blockade, so the win is not given away."""
+    board, color = parse_position(text)
+    score, _ = minimax(board, 3, color == AZUL_MARINHO, None, quiescence=0)
+    assert score >= FORCED_WIN
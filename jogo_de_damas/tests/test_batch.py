@@ -0,0 +1,47 @@
+import copy
+import random
+
+import pytest
+
+from checkers.board import Board
+from checkers.constants import AZUL_MARINHO, WHITE
+
+np = pytest.importorskip("numpy")
+
+from checkers.batch import PositionBatch, evaluate_batch, evaluate_boards
+
+# Esse arquivo confere a avaliação em lote do NumPy contra Board.evaluate.
+
+
+def _random_positions(count, seed):
+    """Return ``count`` boards taken from seeded random games, with kings and near-empty boards among them."""
+    rng = random.Random(seed)
+    boards = []
+    while len(boards) < count:
+        board = Board()
+        color = WHITE
+        for _ in range(rng.randrange(1, 150)):
+            moves = board.legal_moves(color)
+            if not moves:
+                break
+            board.make_move(rng.choice(moves))
+            color = AZUL_MARINHO if color == WHITE else WHITE
+        boards.append(copy.deepcopy(board))
+    return boards
+
+
+def test_batch_matches_evaluate():
+    """200 random positions score exactly as ``Board.evaluate`` does, one by one."""
+    boards = _random_positions(200, 20)
+    assert any(board.bits.kings for board in boards)
+    scores = evaluate_boards(boards)
+    assert scores.dtype == np.int64
+    assert scores.tolist() == [board.evaluate() for board in boards]
+
+
+def test_single_position_batch():
+    """A batch of one position gives the same score as the board."""
+    board = Board()
+    batch = PositionBatch.from_boards([board])
+    assert len(batch) == 1
+    assert evaluate_batch(batch).tolist() == [board.evaluate()]
@@ -0,0 +1,72 @@
+import random
+
+from checkers.board import Board
+from checkers.constants import ROWS, COLS, AZUL_MARINHO, WHITE
+from checkers.evaluation import positional_score
+from checkers.zobrist import hash_position
+
+# Esse arquivo confere a avaliação incremental contra o cálculo completo, percorrendo a matriz de peças.
+
+
+def _reference_evaluate(board):
+    """Score ``board`` from scratch, term by term, as ``evaluate`` did before it became incremental."""
+    score = (board.darkblue_left - board.white_left) * 10
+    score += (board.darkblue_kings - board.white_kings) * 15
+    for row in range(ROWS):
+        for col in range(COLS):
+            piece = board.board[row][col]
+            if piece == 0:
+                continue
+            value = 0
+            if 2 <= row <= 5 and 2 <= col <= 5:
+                value += 3
+            value += row if piece.color == AZUL_MARINHO else ROWS - 1 - row
+            if col == 0 or col == COLS - 1:
+                value -= 2
+            for drow, dcol in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+                r, c = row + drow, col + dcol
+                if 0 <= r < ROWS and 0 <= c < COLS and board.board[r][c] != 0 and board.board[r][c].color == piece.color:
+                    value += 2
+                    break
+            score += value if piece.color == AZUL_MARINHO else -value
+    return score
+
+
+def _random_game(rng, plies):
+    """Play up to ``plies`` random moves from the start and return the board with the undo records."""
+    board = Board()
+    color = WHITE
+    undos = []
+    for _ in range(plies):
+        moves = board.legal_moves(color)
+        if not moves:
+            break
+        undos.append(board.make_move(rng.choice(moves)))
+        color = AZUL_MARINHO if color == WHITE else WHITE
+        yield board, undos
+
+
+def test_incremental_evaluation_matches_the_full_count():
+    """Every position of 60 random games scores the same as the full count, with matching tables and keys."""
+    rng = random.Random(8)
+    positions = 0
+    for _ in range(60):
+        for board, _ in _random_game(rng, 120):
+            assert board.evaluate() == _reference_evaluate(board)
+            assert board.positional == positional_score(board.bits)
+            assert board.hash_key == hash_position(board.bits)
+            positions += 1
+    assert positions > 2000
+
+
+def test_unmake_restores_the_evaluation():
+    """Undoing a random game move by move gives back the score of each earlier position."""
+    rng = random.Random(80)
+    scores = []
+    for board, undos in _random_game(rng, 120):
+        scores.append((board.evaluate(), board.positional, board.hash_key))
+    scores.pop()
+    while scores:
+        board.unmake_move(undos.pop())
+        assert (board.evaluate(), board.positional, board.hash_key) == scores.pop()
+        assert board.evaluate() == _reference_evaluate(board)
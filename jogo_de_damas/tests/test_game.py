@@ -0,0 +1,48 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from checkers.bitboard import coords
+from checkers.notation import parse_position
+from gui.game import Game
+
+# Esse arquivo testa a escolha de jogadas com o mouse.
+
+# A dama em 7 chega a 12 por dois caminhos: tomando 10, 16 e 25 ou tomando 10, 16 e 22
+POSITION = "W:WK7,29:B1,10,16,20,22,25"
+
+
+def _game():
+    """Return a game on ``POSITION`` with white to move."""
+    game = Game(pygame.Surface((1, 1)))
+    game.board, game.turn = parse_position(POSITION)
+    return game
+
+
+def _click(game, number):
+    """Click the square of PDN ``number``."""
+    return game.select(*coords(number - 1))
+
+
+def test_shown_capture_is_the_one_played():
+    """With no choice made, the capture on show is played."""
+    game = _game()
+    _click(game, 7)
+    assert game.captured == {coords(9), coords(15), coords(24)}
+    _click(game, 12)
+    assert game.board.get_piece(*coords(24)) == 0
+    assert game.board.get_piece(*coords(21)) != 0
+
+
+def test_clicking_a_captured_piece_picks_the_other_capture():
+    """Clicking a piece that only the other capture takes switches to it, and that one is played."""
+    game = _game()
+    _click(game, 7)
+    assert _click(game, 22)
+    assert game.selected is not None
+    assert game.captured == {coords(9), coords(15), coords(21)}
+    _click(game, 12)
+    assert game.board.get_piece(*coords(21)) == 0
+    assert game.board.get_piece(*coords(24)) != 0
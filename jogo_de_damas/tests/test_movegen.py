@@ -0,0 +1,114 @@
+import random
+
+from checkers.bitboard import coords, iter_squares
+from checkers.constants import ROWS, COLS
+from checkers.notation import parse_position
+
+# Esse arquivo confere o gerador de jogadas contra uma versão independente e direta das regras, escrita sobre um
+# dicionário de casas: damas voadoras, captura obrigatória e lei da maioria.
+
+KING_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def _directions(color, king):
+    """Return the directions a piece may move or capture in."""
+    if king:
+        return KING_DIRECTIONS
+    return KING_DIRECTIONS[:2] if color == "W" else KING_DIRECTIONS[2:]
+
+
+def _inside(row, col):
+    """Return ``True`` if ``(row, col)`` is on the board."""
+    return 0 <= row < ROWS and 0 <= col < COLS
+
+
+def _captures(pieces, origin):
+    """Return every complete capture of the piece on ``origin`` as ``(dest, captured squares)``."""
+    color, king = pieces[origin]
+    found = set()
+
+    def occupant(cell):
+        # A peça que captura já saiu da casa de origem
+        return None if cell == origin else pieces.get(cell)
+
+    def extend(row, col, taken):
+        extended = False
+        for drow, dcol in _directions(color, king):
+            r, c = row + drow, col + dcol
+            if king:
+                while _inside(r, c) and occupant((r, c)) is None:
+                    r, c = r + drow, c + dcol
+            if not _inside(r, c):
+                continue
+            victim = occupant((r, c))
+            if victim is None or victim[0] == color or (r, c) in taken:
+                continue
+            lr, lc = r + drow, c + dcol
+            while _inside(lr, lc) and occupant((lr, lc)) is None:
+                extended = True
+                extend(lr, lc, taken | {(r, c)})
+                if not king:
+                    break
+                lr, lc = lr + drow, lc + dcol
+        if taken and not extended:
+            found.add(((row, col), taken))
+
+    extend(*origin, frozenset())
+    return found
+
+
+def _quiet(pieces, origin):
+    """Return the destinations of the non-capturing moves of the piece on ``origin``."""
+    color, king = pieces[origin]
+    targets = []
+    for drow, dcol in _directions(color, king):
+        r, c = origin[0] + drow, origin[1] + dcol
+        while _inside(r, c) and (r, c) not in pieces:
+            targets.append((r, c))
+            if not king:
+                break
+            r, c = r + drow, c + dcol
+    return targets
+
+
+def _reference_moves(pieces, side):
+    """Return the legal moves of ``side`` as a set of ``(origin, dest, captured squares)``."""
+    captures = [(origin, dest, taken) for origin in pieces if pieces[origin][0] == side
+                for dest, taken in _captures(pieces, origin)]
+    if captures:
+        most = max(len(taken) for _, _, taken in captures)
+        return {move for move in captures if len(move[2]) == most}
+    return {(origin, dest, frozenset()) for origin in pieces if pieces[origin][0] == side
+            for dest in _quiet(pieces, origin)}
+
+
+def _random_position(rng):
+    """Return a random position as PDN piece lists, with men never on their own promotion row."""
+    white, dark = [], []
+    for sq in rng.sample(range(32), rng.randint(2, 16)):
+        row = coords(sq)[0]
+        king = rng.random() < 0.4
+        if rng.random() < 0.5:
+            white.append(("K" if king or row == 0 else "") + str(sq + 1))
+        else:
+            dark.append(("K" if king or row == ROWS - 1 else "") + str(sq + 1))
+    return white, dark
+
+
+def test_legal_moves_match_the_reference():
+    """Both sides of 4,000 random positions get exactly the moves of the reference generator, once each."""
+    rng = random.Random(11)
+    for _ in range(4000):
+        white, dark = _random_position(rng)
+        for side in "WB":
+            board, color = parse_position(f"{side}:W{','.join(white)}:B{','.join(dark)}")
+            pieces = {}
+            for sq in iter_squares(board.bits.darkblue | board.bits.white):
+                pieces[coords(sq)] = ("W" if board.bits.white >> sq & 1 else "B", bool(board.bits.kings >> sq & 1))
+            moves = board.legal_moves(color)
+            got = set()
+            for origin, dest, captured, path in moves:
+                assert path[-1] == dest if captured else path == ()
+                got.add((coords(origin), coords(dest), frozenset(coords(sq) for sq in iter_squares(captured))))
+            assert len(got) == len(moves)
+            assert got == _reference_moves(pieces, side)
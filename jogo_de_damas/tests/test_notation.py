@@ -0,0 +1,26 @@
+import pytest
+
+from checkers.constants import AZUL_MARINHO
+from checkers.notation import parse_position, position_text
+
+# Esse arquivo testa a leitura e a escrita de posições em texto.
+
+
+def test_round_trip():
+    """A parsed position is written back exactly."""
+    text = "B:WK4,18,20:B8,K25,28"
+    board, color = parse_position(text)
+    assert color == AZUL_MARINHO
+    assert position_text(board, color) == text
+
+
+@pytest.mark.parametrize("text", [
+    "W:W18,20:B8,18",   # mesma casa para as duas cores
+    "W:W18,K18:B8",     # mesma casa duas vezes na mesma cor
+    "W:W2,20:B8",       # homem branco na fileira de promoção
+    "W:W18:B8,30",      # homem azul na fileira de promoção
+])
+def test_inconsistent_positions_are_rejected(text):
+    """Squares listed twice and men on their promotion row raise ``ValueError``."""
+    with pytest.raises(ValueError):
+        parse_position(text)
@@ -0,0 +1,35 @@
+import pytest
+
+from checkers.board import Board
+from checkers.constants import AZUL_MARINHO, WHITE
+from checkers.notation import parse_position
+from minimax.agent import minimax
+from minimax.parallel import ParallelSearch
+
+# Esse arquivo confere a busca paralela contra a sequencial.
+
+# Posições com capturas pendentes, onde uma folha sem quiescência teria outra nota
+POSITIONS = ["W:W21,22,23,25,26,27,28,29,30,31,32:B1,2,3,4,5,6,7,8,9,10,11,17", "B:W18,20:B8,K25,28"]
+
+
+@pytest.fixture(scope="module")
+def search():
+    """One worker pool shared by the module."""
+    with ParallelSearch(2, table_size=1 << 12) as parallel:
+        yield parallel
+
+
+def _bits(board):
+    """Return the masks that identify the position of ``board``."""
+    return board.bits.darkblue, board.bits.white, board.bits.kings
+
+
+@pytest.mark.parametrize("depth", [0, 1, 2, 4])
+def test_parallel_matches_minimax(search, depth):
+    """The parallel root split gives the score and the move of ``minimax`` at the same depth."""
+    positions = [(Board(), WHITE)] + [parse_position(text) for text in POSITIONS]
+    for board, color in positions:
+        expected_score, expected_board = minimax(board, depth, color == AZUL_MARINHO, None)
+        score, chosen = search.search(board, depth, color == AZUL_MARINHO)
+        assert score == expected_score
+        assert _bits(chosen) == _bits(expected_board)
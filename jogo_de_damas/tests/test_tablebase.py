@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from checkers.notation import parse_position, move_text
+from checkers.board import DRAW_KING_PLIES
+from minimax.agent import minimax, iterative_deepening, FORCED_WIN
+from minimax.proof import proof_number_search
+from minimax.stats import SearchStats
+from minimax.tablebase import Tablebase, WIN
+from minimax.transposition import TranspositionTable
+
+# Esse arquivo testa o uso das tabelas de finais pela busca.
+
+TABLEBASE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "finais.bin")
+# Só damas: o azul marinho ganha em 7 lances, todos de dama até a captura final
+KINGS_ONLY_WIN = "B:WK5:BK24,K28"
+
+
+@pytest.fixture(scope="module")
+def tablebase():
+    """Open the shipped tables, skipping when they have not been built."""
+    if not os.path.exists(TABLEBASE):
+        pytest.skip("assets/finais.bin não foi gerado")
+    tables = Tablebase(TABLEBASE)
+    yield tables
+    tables.close()
+
+
+def test_finishing_the_game_beats_reaching_the_tables(tablebase):
+    """Capturing every piece is not traded for a tablebase win that gives material away."""
+    scores = []
+    for tables in (None, tablebase):
+        board, _ = parse_position("B:W30:BK18,23,K32")
+        stats = SearchStats()
+        score, _ = minimax(board, 3, True, None, stats=stats, tablebase=tables)
+        scores.append(score)
+        assert score >= FORCED_WIN
+        assert move_text(stats.principal_variation[0]) != "23-26"
+    assert scores[0] == scores[1]
+
+
+def test_table_scores_do_not_depend_on_the_path(tablebase):
+    """A tablebase score stored at one ply and read at another still counts from the root."""
+    text = "B:W23,24:BK8,K22"
+    board, _ = parse_position(text)
+    fresh, _ = minimax(board, 3, True, None, table=TranspositionTable(1 << 12), tablebase=tablebase)
+
+    # Os filhos são buscados antes como raiz, e a busca do pai os encontra na tabela um lance mais fundo
+    shared = TranspositionTable(1 << 12)
+    board, color = parse_position(text)
+    for move in list(board.legal_moves(color)):
+        undo = board.make_move(move)
+        minimax(board, 2, False, None, table=shared, tablebase=tablebase)
+        board.unmake_move(undo)
+    reused, _ = minimax(board, 3, True, None, table=shared, tablebase=tablebase)
+    assert fresh >= FORCED_WIN
+    assert reused == fresh
+
+
+@pytest.mark.parametrize("reversible", [0, DRAW_KING_PLIES - 8])
+def test_table_wins_within_the_forty_ply_rule(tablebase, reversible):
+    """A table win that ends before the forty-ply rule is used as it is."""
+    board, _ = parse_position(KINGS_ONLY_WIN)
+    board.reversible = reversible
+    assert tablebase.probe_position(board, True) == (WIN, 7)
+    assert proof_number_search(board, True, 100000, tablebase=tablebase)[0] is True
+    assert minimax(board, 4, True, None, tablebase=tablebase)[0] >= FORCED_WIN
+
+
+def test_table_wins_past_the_forty_ply_rule_are_not_trusted(tablebase):
+    """With too few king plies left, the table win is a draw under the game rules and the searches see it."""
+    board, _ = parse_position(KINGS_ONLY_WIN)
+    board.reversible = DRAW_KING_PLIES - 4
+    assert tablebase.probe(board.bits, True) == (WIN, 7)
+    assert tablebase.probe_position(board, True) is None
+    assert tablebase.best_move(board, True) is None
+    assert proof_number_search(board, True, 100000, tablebase=tablebase)[0] is False
+    assert minimax(board, 8, True, None, tablebase=tablebase)[0] < FORCED_WIN
+    assert iterative_deepening(board, True, None, node_limit=20000, tablebase=tablebase)[0] < FORCED_WIN
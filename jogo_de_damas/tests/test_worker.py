@@ -0,0 +1,36 @@
+import time
+
+from checkers.board import Board
+from minimax.worker import SearchWorker
+
+# Esse arquivo testa a busca em segundo plano.
+
+
+def _wait(worker):
+    """Block until the search thread of ``worker`` has finished."""
+    while worker.running:
+        time.sleep(0.01)
+
+
+def test_start_keeps_a_result_that_finished_before_poll():
+    """A search that ends between ``poll`` and ``start`` for the same position is not thrown away."""
+    board = Board()
+    worker = SearchWorker(node_limit=200)
+    worker.start(board, True)
+    _wait(worker)
+    # O loop do jogo viu "not running" e chama start de novo antes de buscar o resultado
+    worker.start(board, True)
+    assert not worker.running
+    assert worker.poll() is not None
+
+
+def test_start_discards_a_result_for_another_position():
+    """A finished result for a different position is replaced by a new search."""
+    board = Board()
+    worker = SearchWorker(node_limit=200)
+    worker.start(board, True)
+    _wait(worker)
+    worker.start(board, False)
+    _wait(worker)
+    score, after = worker.poll()
+    assert after.bits.white != board.bits.white
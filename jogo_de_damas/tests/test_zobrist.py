@@ -0,0 +1,24 @@
+from checkers.notation import parse_position
+from checkers.zobrist import position_key
+from minimax.agent import minimax
+
+# Esse arquivo testa as chaves de Zobrist.
+
+# Vinte damas brancas contra duas azuis: mais damas de uma cor do que uma partida real chega a ter
+MANY_KINGS = "W:W" + ",".join(f"K{number}" for number in range(1, 21)) + ":BK31,K32"
+
+
+def test_position_key_with_many_kings():
+    """A set-up position with more than 16 kings of one colour has a key and can be searched."""
+    board, _ = parse_position(MANY_KINGS)
+    assert board.white_kings == 20
+    assert position_key(board, False) != position_key(board, True)
+    minimax(board, 2, False, None)
+
+
+def test_position_key_counts_promotions():
+    """The same pieces with a different promotion count get another key."""
+    board, _ = parse_position(MANY_KINGS)
+    key = position_key(board, False)
+    board.white_kings += 12
+    assert position_key(board, False) != key